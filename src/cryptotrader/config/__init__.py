@@ -1,12 +1,12 @@
 """
 Configuration package for the CryptoTrader application.
 
-This package contains all configuration-related modules:
-- settings: Application settings and environment variables
-- logging: Logging configuration
+This package is the single source of configuration for the application:
+- secrets: Environment variables and API credentials (Secrets, get_env)
+- log_config: Logging configuration (get_logger, setup_logging, get_log_level)
 """
 
-from .secrets import Secrets
-from .log_config import get_logger
+from .secrets import Secrets, get_env
+from .log_config import get_log_level, get_logger, setup_logging
 
-__all__ = ['Secrets', 'get_logger']
+__all__ = ['Secrets', 'get_env', 'get_log_level', 'get_logger', 'setup_logging']
@@ -5,9 +5,13 @@ This module provides a consistent logging setup across the application with colo
 output and configuration options that can be adjusted through environment variables.
 """
 
+import atexit
+import copy
 import os
+import queue
 import sys
 import logging
+import logging.handlers
 from colorama import Fore, Style, init
 
 # Initialize colorama (required for Windows compatibility)
@@ -24,48 +28,95 @@ LEVEL_COLORS = {
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter that adds colors to log level names in terminal output."""
-    
-    def format(self, record):
-        # Save original levelname
-        orig_levelname = record.levelname
-        # Add color to levelname based on log level
-        if record.levelno in LEVEL_COLORS:
-            record.levelname = f"{LEVEL_COLORS[record.levelno]}{record.levelname}{Style.RESET_ALL}"
-        
-        # Format the message
-        result = super().format(record)
-        
-        # Restore original levelname
-        record.levelname = orig_levelname
-        return result
 
-# Configure root logger with colored formatting
-log_level_name = os.environ.get('LOG_LEVEL', 'INFO').upper()
-log_level = getattr(logging, log_level_name, logging.INFO)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Build each colored level name once instead of on every record
+        self._colored_levelnames = {
+            level: f"{color}{logging.getLevelName(level)}{Style.RESET_ALL}"
+            for level, color in LEVEL_COLORS.items()
+        }
+    
+    def formatMessage(self, record):
+        colored = self._colored_levelnames.get(record.levelno)
+        if colored is None:
+            return super().formatMessage(record)
 
-# Configure the root logger
-root_logger = logging.getLogger()
-root_logger.setLevel(log_level)
+        # Color a shallow copy so other handlers never see the escape codes
+        record = copy.copy(record)
+        record.levelname = colored
+        return super().formatMessage(record)
 
-# Create console handler
-console_handler = logging.StreamHandler()
-console_handler.setLevel(log_level)
+# Resolved once at import; neither the terminal nor LOG_LEVEL changes while running
+_IS_TTY = sys.stdout.isatty()
+_LEVEL_MAP = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+    'NOTSET': logging.NOTSET,
+    'WARN': logging.WARNING,
+    'FATAL': logging.CRITICAL,
+}
+_LOG_LEVEL = _LEVEL_MAP.get(os.environ.get('LOG_LEVEL', 'INFO').upper(), logging.INFO)
 
 # Define the log format
 log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 date_format = '%Y-%m-%d %H:%M:%S'
 
-# Use colored formatting if output is to a terminal
-if sys.stdout.isatty():
-    formatter = ColoredFormatter(log_format, datefmt=date_format)
-else:
-    formatter = logging.Formatter(log_format, datefmt=date_format)
+_LOGGING_CONFIGURED = False
+_queue_listener = None
+
+
+def setup_logging() -> None:
+    """
+    Attach the application's console handler to the root logger.
+
+    Safe to call any number of times: the handler is only added once, and not at
+    all if the root logger was already configured elsewhere (e.g. basicConfig),
+    so records are never emitted twice.
+
+    The console handler runs behind a QueueHandler/QueueListener pair, so the
+    logging thread (GUI loop, websocket handlers) only enqueues the record and
+    the formatting and stream writes happen on the listener's thread.
+    """
+    global _LOGGING_CONFIGURED, _queue_listener
+    if _LOGGING_CONFIGURED:
+        return
+    _LOGGING_CONFIGURED = True
+
+    # Configure the root logger
+    root_logger = logging.getLogger()
+    root_logger.setLevel(_LOG_LEVEL)
 
-console_handler.setFormatter(formatter)
+    # Only add handler if it hasn't been added already
+    if root_logger.handlers:
+        return
 
-# Only add handler if it hasn't been added already
-if not root_logger.handlers:
-    root_logger.addHandler(console_handler)
+    # Create console handler
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(_LOG_LEVEL)
+
+    # Use colored formatting if output is to a terminal
+    if _IS_TTY:
+        formatter = ColoredFormatter(log_format, datefmt=date_format)
+    else:
+        formatter = logging.Formatter(log_format, datefmt=date_format)
+
+    console_handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, console_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+    # Drain anything still queued before the interpreter exits
+    atexit.register(_queue_listener.stop)
+
+
+setup_logging()
 
 def get_logger(name: str) -> logging.Logger:
     """
@@ -78,3 +129,13 @@ def get_logger(name: str) -> logging.Logger:
         A configured logger instance
     """
     return logging.getLogger(name)
+
+
+def get_log_level() -> int:
+    """
+    Get the application's configured log level.
+
+    Returns:
+        The numeric logging level resolved from LOG_LEVEL at start-up
+    """
+    return _LOG_LEVEL
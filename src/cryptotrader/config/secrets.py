@@ -3,18 +3,85 @@ Secrets configuration module for the CryptoTrader application.
 """
 
 import os
+from pathlib import Path
+from types import MappingProxyType
+from typing import Optional
+
 from dotenv import load_dotenv
 
+_HERE = Path(__file__).resolve().parent
+
+_DOTENV_LOADED = False
+_DOTENV_PATH: Optional[str] = None
+
+
+def _find_dotenv() -> Optional[str]:
+    """
+    Locate the .env file, searching upward from this package and then the cwd.
+
+    Each candidate directory is listed once with os.scandir rather than probed
+    with a stat call per path, and the result is cached for the process.
+
+    Returns:
+        Path to the .env file, or None if none was found
+    """
+    global _DOTENV_PATH
+    if _DOTENV_PATH is not None:
+        return _DOTENV_PATH
+
+    candidate_dirs = dict.fromkeys([_HERE, *_HERE.parents, Path.cwd()])
+    for directory in candidate_dirs:
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name == '.env' and entry.is_file():
+                        _DOTENV_PATH = entry.path
+                        return _DOTENV_PATH
+        except OSError:
+            continue
+    return None
+
+
+def _ensure_env() -> None:
+    """Load the .env file into the environment, at most once per process."""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        dotenv_path = _find_dotenv()
+        if dotenv_path:
+            load_dotenv(dotenv_path=dotenv_path)
+        _DOTENV_LOADED = True
+
+
 # Load environment variables from .env file
-load_dotenv()
+_ensure_env()
+
+# Read-only snapshot of the environment, taken once after the .env file is applied.
+# Environment variables are not expected to change after start-up, so lookups go
+# through this plain dict instead of re-encoding keys against os.environ each time.
+_ENV = MappingProxyType(dict(os.environ))
+
+
+def get_env(name: str, default: Optional[str] = None) -> Optional[str]:
+    """
+    Read a configuration value from the environment snapshot.
+
+    Args:
+        name: Environment variable name
+        default: Value returned when the variable is not set
+
+    Returns:
+        The variable's value, or the default
+    """
+    return _ENV.get(name, default)
+
 
 class Secrets:
     """Secrets settings for the CryptoTrader application."""
        
     # Binance API settings
-    BINANCE_API_KEY = os.environ.get('BINANCE_API_KEY')
-    BINANCE_API_SECRET = os.environ.get('BINANCE_API_SECRET')
+    BINANCE_API_KEY = get_env('BINANCE_API_KEY')
+    BINANCE_API_SECRET = get_env('BINANCE_API_SECRET')
 
     # Crypto API settings
-    CRYPTO_API_KEY = os.environ.get('CRYPTO_API_KEY')
-    CRYPTO_API_SECRET = os.environ.get('CRYPTO_API_SECRET')
+    CRYPTO_API_KEY = get_env('CRYPTO_API_KEY')
+    CRYPTO_API_SECRET = get_env('CRYPTO_API_SECRET')
@@ -12,7 +12,9 @@ Displays interactive candlestick charts for cryptocurrency trading.
 
 import tkinter as tk
 from tkinter import ttk
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from operator import attrgetter
 from typing import List, Dict, Optional, Any, Tuple, Union, cast
 
 # For matplotlib integration with Tkinter
@@ -20,6 +22,7 @@ import matplotlib
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 import matplotlib.dates as mdates
+from matplotlib.collections import LineCollection, PatchCollection
 from matplotlib.patches import Rectangle
 import matplotlib.axes
 import numpy as np
@@ -30,6 +33,34 @@ from cryptotrader.gui.components.styles import Colors
 
 logger = get_logger(__name__)
 
+# Milliseconds between checks for a finished background candle fetch
+RESULT_POLL_MS = 50
+# Quiet period after a symbol/timeframe change before the chart is refetched
+REFRESH_DEBOUNCE_MS = 150
+# Number of candles shown on the chart
+CANDLE_LIMIT = 100
+
+_MS_PER_DAY = 86_400_000
+
+# Candle spacing in seconds and x-axis date format per supported timeframe
+_TIMEFRAME_SECONDS = {
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "1h": 3600,
+    "4h": 14400,
+    "1d": 86400,
+}
+_TIMEFRAME_FORMATS = {
+    "1m": "%H:%M",
+    "5m": "%H:%M",
+    "15m": "%H:%M",
+    "30m": "%d-%H:%M",
+    "1h": "%d-%H:%M",
+    "4h": "%d-%H:%M",
+}
+
 
 class CandlestickChart:
     """Matplotlib canvas for displaying candlestick charts."""
@@ -83,6 +114,19 @@ class CandlestickChart:
         self.symbol: str = ""
         self.timeframe: str = ""
 
+        # Candle artists, created on the first plot and updated in place after
+        self._wicks: Optional[LineCollection] = None
+        self._bodies: Optional[PatchCollection] = None
+
+        # Axes without the candles, captured after every full draw (including
+        # resizes and toolbar zoom/pan) so data-only updates can be blitted
+        self._background: Optional[Any] = None
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
+        # Full candle arrays; only the slice inside the x-limits is drawn
+        self._ohlc: Optional[Tuple[np.ndarray, ...]] = None
+        self.axes.callbacks.connect("xlim_changed", self._on_xlim_changed)
+
     def get_widget(self) -> tk.Widget:
         """Get the canvas widget for packing."""
         return self.canvas_widget
@@ -91,6 +135,157 @@ class CandlestickChart:
         """Get the toolbar widget for packing."""
         return self.toolbar
 
+    def _on_draw(self, event: Any) -> None:
+        """Capture the static background and draw the candles over it."""
+        self._background = self.canvas.copy_from_bbox(self.axes.bbox)
+        self._draw_candle_artists()
+
+    def _draw_candle_artists(self) -> None:
+        """Render the (animated) candle collections onto the canvas."""
+        if self._bodies is not None:
+            self.axes.draw_artist(self._bodies)
+        if self._wicks is not None:
+            self.axes.draw_artist(self._wicks)
+
+    def _blit_candles(self) -> None:
+        """Redraw only the candles over the cached background."""
+        self.canvas.restore_region(self._background)
+        self._draw_candle_artists()
+        self.canvas.blit(self.axes.bbox)
+        self.canvas.flush_events()
+
+    def _fits_view(self, extents: List[Tuple[float, float]]) -> bool:
+        """Check whether the candle extents lie inside the current axis limits."""
+        (x_min, y_min), (x_max, y_max) = extents
+        x_low, x_high = self.axes.get_xlim()
+        y_low, y_high = self.axes.get_ylim()
+        return x_low <= x_min and x_max <= x_high and y_low <= y_min and y_max <= y_high
+
+    def _on_xlim_changed(self, axes: matplotlib.axes.Axes) -> None:
+        """Re-cull the candles whenever the view is panned or zoomed."""
+        if self._ohlc is not None:
+            self._draw_candles(*self._visible_candles())
+
+    def _visible_candles(self) -> Tuple[np.ndarray, ...]:
+        """Slice the candle arrays to the current x-limits.
+
+        When more candles are visible than the axes is wide in pixels,
+        neighbouring candles are merged into one (first open, highest high,
+        lowest low, last close) so the artist count stays bounded.
+
+        Returns:
+            Tuple of (x, opens, highs, lows, closes, widths) for drawing
+        """
+        x, opens, highs, lows, closes, widths = self._ohlc
+        x_low, x_high = self.axes.get_xlim()
+        start, stop = np.searchsorted(x, (x_low, x_high))
+        # Keep one candle either side so partially visible bodies are drawn
+        visible = slice(max(start - 1, 0), min(stop + 1, len(x)))
+        x, opens, highs, lows, closes, widths = (
+            values[visible] for values in (x, opens, highs, lows, closes, widths)
+        )
+
+        step = -(-len(x) // max(int(self.axes.bbox.width), 1))
+        if step > 1:
+            firsts = np.arange(0, len(x), step)
+            lasts = np.minimum(firsts + step - 1, len(x) - 1)
+            x = (x[firsts] + x[lasts]) / 2
+            opens = opens[firsts]
+            highs = np.maximum.reduceat(highs, firsts)
+            lows = np.minimum.reduceat(lows, firsts)
+            closes = closes[lasts]
+            widths = np.add.reduceat(widths, firsts)
+
+        return x, opens, highs, lows, closes, widths
+
+    @staticmethod
+    def _extract_ohlc(candles: List[Any]) -> Tuple[np.ndarray, ...]:
+        """Convert candle objects into NumPy arrays in a single pass.
+
+        Args:
+            candles: List of candle data objects
+
+        Returns:
+            Tuple of (matplotlib date numbers, opens, highs, lows, closes)
+        """
+        if hasattr(candles[0], "openPrice"):
+            fields = ("openPrice", "highPrice", "lowPrice", "closePrice")
+        else:
+            fields = ("open", "high", "low", "close")
+        getter = attrgetter("timestamp", *fields)
+        data = np.array([getter(candle) for candle in candles], dtype=np.float64)
+        timestamps, opens, highs, lows, closes = data.T
+
+        # Shift to local time so the axis matches datetime.fromtimestamp()
+        utc_offset = (
+            datetime.fromtimestamp(timestamps[-1] / 1000).astimezone().utcoffset()
+        )
+        local_ms = timestamps + utc_offset.total_seconds() * 1000
+
+        # matplotlib dates are days since its epoch, so milliseconds convert
+        # with one scale and shift; no datetime objects are created
+        x = local_ms / _MS_PER_DAY + mdates.date2num(np.datetime64(0, "ms"))
+
+        return x, opens, highs, lows, closes
+
+    def _draw_candles(
+        self,
+        x: np.ndarray,
+        opens: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
+        widths: np.ndarray,
+    ) -> None:
+        """Draw wicks and bodies as two collections instead of one artist per candle.
+
+        The collections are created on first use and afterwards updated with
+        set_segments/set_paths, so refreshes don't add or remove artists. They
+        are animated, so full draws leave them out of the cached background.
+        """
+        wick_segments = np.stack(
+            [np.column_stack([x, lows]), np.column_stack([x, highs])], axis=1
+        )
+        bottoms = np.minimum(opens, closes)
+        heights = np.abs(closes - opens)
+        bodies = [
+            Rectangle((left, bottom), width, height)
+            for left, bottom, width, height in zip(
+                x - widths / 2, bottoms, widths, heights
+            )
+        ]
+        face_colors = np.where(closes >= opens, "green", "red").tolist()
+
+        if self._wicks is None or self._bodies is None:
+            self._wicks = LineCollection(
+                wick_segments, colors="black", linewidths=1, animated=True
+            )
+            self._bodies = PatchCollection(
+                bodies,
+                facecolors=face_colors,
+                edgecolors="black",
+                linewidths=0.5,
+                animated=True,
+            )
+            self.axes.add_collection(self._wicks, autolim=False)
+            self.axes.add_collection(self._bodies, autolim=False)
+        else:
+            self._wicks.set_segments(wick_segments)
+            self._bodies.set_paths(bodies)
+            self._bodies.set_facecolor(face_colors)
+
+    def _configure_axes(self, symbol: str, timeframe: str) -> None:
+        """Set up the title and date axis for a newly selected symbol/timeframe."""
+        self.axes.set_title(f"{symbol} {timeframe} Chart")
+        self.axes.xaxis_date()
+        self.fig.autofmt_xdate()
+        self.axes.grid(True, alpha=0.3)
+
+        # Apply better x-axis formatting
+        self.axes.xaxis.set_major_formatter(
+            mdates.DateFormatter(_TIMEFRAME_FORMATS.get(timeframe, "%Y-%m-%d"))
+        )
+
     def plot_candles(self, candles: List[Any], symbol: str, timeframe: str) -> None:
         """Plot candlestick data on the chart.
 
@@ -102,76 +297,51 @@ class CandlestickChart:
         if not candles:
             return
 
+        same_chart = symbol == self.symbol and timeframe == self.timeframe
         self.candles = candles
         self.symbol = symbol
         self.timeframe = timeframe
 
-        self.axes.clear()
-        dates: List[datetime] = []
-
-        for candle in candles:
-            try:
-                timestamp = candle.timestamp
-                openPrice = candle.open
-                highPrice = candle.high
-                lowPrice = candle.low
-                closePrice = candle.close
-            except AttributeError:
-                # fallback for dict or list-based data
-                timestamp = candle.timestamp
-                openPrice = candle.openPrice
-                highPrice = candle.highPrice
-                lowPrice = candle.lowPrice
-                closePrice = candle.closePrice
-
-            date = datetime.fromtimestamp(timestamp / 1000)
-            dates.append(date)
-
-            color = "green" if closePrice >= openPrice else "red"
-            self.axes.plot(
-                [date, date], [lowPrice, highPrice], color="black", linewidth=1
-            )
-
-            if len(dates) > 1:
-                # Convert dates to numbers for width calculation
-                date_num_current = mdates.date2num(date)
-                date_num_prev = mdates.date2num(dates[-2])
-                width = (date_num_current - date_num_prev) * 0.8
-            else:
-                width = 0.01  # fallback
-
-            rect = Rectangle(
-                (mdates.date2num(date) - width / 2, min(openPrice, closePrice)),
-                width=width,
-                height=abs(closePrice - openPrice),
-                facecolor=color,
-                edgecolor="black",
-                linewidth=0.5,
-            )
-            self.axes.add_patch(rect)
+        x, opens, highs, lows, closes = self._extract_ohlc(candles)
+
+        # Bodies are 80% of the candle spacing, which is fixed per timeframe
+        # (matplotlib dates are in days)
+        seconds = _TIMEFRAME_SECONDS.get(timeframe)
+        if seconds is not None:
+            widths = np.full_like(x, seconds / 86400 * 0.8)
+        elif len(x) > 1:
+            widths = np.empty_like(x)
+            widths[1:] = np.diff(x) * 0.8
+            widths[0] = widths[1]
+        else:
+            widths = np.full_like(x, 0.01)  # fallback
 
-        self.axes.set_title(f"{symbol} {timeframe} Chart")
-        self.axes.xaxis_date()
-        self.fig.autofmt_xdate()
-        self.axes.grid(True, alpha=0.3)
+        self._ohlc = (x, opens, highs, lows, closes, widths)
+        extents = [(x[0] - widths[0], lows.min()), (x[-1] + widths[-1], highs.max())]
 
-        # Apply better x-axis formatting
-        if timeframe in ["1m", "5m", "15m"]:
-            self.axes.xaxis.set_major_formatter(mdates.DateFormatter("%H:%M"))
-        elif timeframe in ["30m", "1h", "4h"]:
-            self.axes.xaxis.set_major_formatter(mdates.DateFormatter("%d-%H:%M"))
-        else:
-            self.axes.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m-%d"))
+        # A refresh that stays inside the current view (e.g. the last candle
+        # ticking) only needs the candles redrawn, not the axes, ticks and grid
+        if same_chart and self._background is not None and self._fits_view(extents):
+            self._draw_candles(*self._visible_candles())
+            self._blit_candles()
+            return
 
-        # Configure axes colors for dark theme
-        self.axes.spines["bottom"].set_color(Colors.FOREGROUND)
-        self.axes.spines["top"].set_color(Colors.FOREGROUND)
-        self.axes.spines["left"].set_color(Colors.FOREGROUND)
-        self.axes.spines["right"].set_color(Colors.FOREGROUND)
-        self.axes.tick_params(colors=Colors.FOREGROUND)
-        self.axes.xaxis.label.set_color(Colors.FOREGROUND)
-        self.axes.yaxis.label.set_color(Colors.FOREGROUND)
-        self.axes.title.set_color(Colors.FOREGROUND)
+        # Title, date axis and formatter only change with the symbol/timeframe;
+        # the dark theme set in __init__ survives since the axes aren't cleared
+        if not same_chart:
+            self._configure_axes(symbol, timeframe)
+            # Toolbar zoom and pan turn autoscaling off, and without clearing
+            # the axes nothing turns it back on. A new chart always fits its
+            # data, and Home should not return to the previous chart's view.
+            self.axes.set_autoscale_on(True)
+            self.toolbar.update()
+
+        # relim() ignores collections, so reset the data limits to the candle
+        # extents before autoscaling
+        self.axes.ignore_existing_data_limits = True
+        self.axes.update_datalim(extents)
+        self.axes.autoscale_view()
+        self._draw_candles(*self._visible_candles())
 
         self.canvas.draw()
 
@@ -186,6 +356,16 @@ class ChartWidget(ttk.Frame):
         self.current_symbol: str = "BTCUSDT"
         self.current_timeframe: str = "1h"
 
+        # Candle requests run on a worker thread so the UI stays responsive
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="chart-fetch"
+        )
+        self._pending: Optional[Future] = None
+        # after() id of the debounced refresh, if one is scheduled
+        self._refresh_job: Optional[str] = None
+        # Last candles per (symbol, interval); only touched on the worker thread
+        self._candle_cache: Dict[Tuple[str, str], List[Any]] = {}
+
         self.init_ui()
 
     def init_ui(self) -> None:
@@ -254,36 +434,88 @@ class ChartWidget(ttk.Frame):
     def symbol_changed(self, symbol: str) -> None:
         """Handle symbol change event."""
         self.current_symbol = symbol
-        self.refresh_chart()
+        self._schedule_refresh()
 
     def timeframe_changed(self, timeframe: str) -> None:
         """Handle timeframe change event."""
         self.current_timeframe = timeframe
-        self.refresh_chart()
+        self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        """Debounce refreshes so rapid control changes trigger a single fetch."""
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+        self._refresh_job = self.after(REFRESH_DEBOUNCE_MS, self.refresh_chart)
 
     def refresh_chart(self) -> None:
-        """Refresh chart data."""
-        try:
-            # Convert timeframe to API format (e.g., 1h -> 1h)
-            interval = self.current_timeframe
+        """Refresh chart data.
 
-            # Fetch candle data
-            candle_data = self.market_client.getHistoricalCandles(
-                symbol=self.current_symbol,
+        The candles are fetched on a worker thread; _collect_candles plots them
+        from the Tk loop once the request completes.
+        """
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+            self._refresh_job = None
+        symbol = self.current_symbol
+        # Convert timeframe to API format (e.g., 1h -> 1h)
+        interval = self.current_timeframe
+
+        # Fetch candle data
+        future = self._executor.submit(self._fetch_candles, symbol, interval)
+        self._pending = future
+        self.after(RESULT_POLL_MS, self._collect_candles, future, symbol, interval)
+
+    def _fetch_candles(self, symbol: str, interval: str) -> List[Any]:
+        """Fetch the last CANDLE_LIMIT candles, reusing cached history.
+
+        Runs on the worker thread. With a cache, only candles from the newest
+        cached one (which may still have been open) onwards are requested. A
+        full window is fetched when there is no cache or the gap is too large
+        for one request.
+        """
+        key = (symbol, interval)
+        cached = self._candle_cache.get(key)
+        if cached:
+            latest = self.market_client.getHistoricalCandles(
+                symbol=symbol,
                 interval=interval,
-                limit=100,  # Last 100 candles
+                limit=CANDLE_LIMIT,
+                start_time=cached[-1].timestamp,
             )
+            if latest and len(latest) < CANDLE_LIMIT:
+                first_new = latest[0].timestamp
+                candles = [c for c in cached if c.timestamp < first_new] + latest
+                self._candle_cache[key] = candles[-CANDLE_LIMIT:]
+                return self._candle_cache[key]
+
+        candles = self.market_client.getHistoricalCandles(
+            symbol=symbol,
+            interval=interval,
+            limit=CANDLE_LIMIT,  # Last 100 candles
+        )
+        if candles:
+            self._candle_cache[key] = candles
+        return candles
+
+    def _collect_candles(self, future: Future, symbol: str, timeframe: str) -> None:
+        """Plot the result of a background candle fetch once it is ready."""
+        if not future.done():
+            self.after(RESULT_POLL_MS, self._collect_candles, future, symbol, timeframe)
+            return
+        # A newer refresh was started meanwhile; its result wins
+        if future is not self._pending:
+            return
+        self._pending = None
+
+        try:
+            candle_data = future.result()
 
             if candle_data:
                 # Plot the data
-                self.chart.plot_candles(
-                    candle_data, self.current_symbol, self.current_timeframe
-                )
-                logger.info(
-                    f"Updated chart for {self.current_symbol} ({self.current_timeframe})"
-                )
+                self.chart.plot_candles(candle_data, symbol, timeframe)
+                logger.info(f"Updated chart for {symbol} ({timeframe})")
             else:
-                logger.error(f"Failed to fetch candle data for {self.current_symbol}")
+                logger.error(f"Failed to fetch candle data for {symbol}")
 
         except Exception as e:
             logger.error(f"Error refreshing chart: {str(e)}")
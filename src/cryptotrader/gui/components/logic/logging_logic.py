@@ -1,34 +1,60 @@
 import time
-from typing import List, Dict
+from collections import deque
+from dataclasses import dataclass
+from itertools import islice
+from typing import Deque, List
 from cryptotrader.config import get_logger
 
 logger = get_logger(__name__)
 
+# Oldest entries are dropped once this many logs are held
+MAX_LOGS = 10_000
+
+# Level name -> how the message is forwarded to the application logger
+_LOG_DISPATCH = {
+    "ERROR": logger.error,
+    "WARNING": logger.warning,
+    "SUCCESS": lambda message: logger.info("[SUCCESS] %s", message),
+}
+
+
+@dataclass(slots=True, frozen=True)
+class LogEntry:
+    """A single line shown in the logging panel."""
+
+    timestamp: str
+    level: str
+    message: str
+
 
 class LoggingLogic:
     """Handles logging operations separate from the UI."""
 
     def __init__(self):
-        self.logs: List[Dict] = []
-
-    def add_log(self, message: str, level: str = "INFO") -> Dict:
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = {"timestamp": timestamp, "level": level.upper(), "message": message}
+        self.logs: Deque[LogEntry] = deque(maxlen=MAX_LOGS)
+        # strftime is only re-run when the second changes
+        self._ts_cache_sec = -1
+        self._ts_cache_str = ""
+
+    def add_log(self, message: str, level: str = "INFO") -> LogEntry:
+        now = int(time.time())
+        if now != self._ts_cache_sec:
+            self._ts_cache_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            self._ts_cache_sec = now
+        level = level.upper()
+        log_entry = LogEntry(self._ts_cache_str, level, message)
         self.logs.append(log_entry)
 
-        if level.upper() == "ERROR":
-            logger.error(message)
-        elif level.upper() == "WARNING":
-            logger.warning(message)
-        elif level.upper() == "SUCCESS":
-            logger.info(f"[SUCCESS] {message}")
-        else:
-            logger.info(message)
+        _LOG_DISPATCH.get(level, logger.info)(message)
 
         return log_entry
 
     def clear_logs(self):
         self.logs.clear()
 
-    def get_all_logs(self) -> List[Dict]:
+    def get_all_logs(self) -> List[LogEntry]:
         return list(self.logs)
+
+    def get_recent(self, n: int) -> List[LogEntry]:
+        """Return the newest n logs, oldest first, without copying the rest."""
+        return list(islice(self.logs, max(0, len(self.logs) - n), None))
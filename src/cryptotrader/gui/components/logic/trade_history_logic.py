@@ -5,18 +5,45 @@ Trade History Logic
 
 Handles fetching trade data and calculating PNL.
 """
+from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
 from typing import List, Optional
 from cryptotrader.config import get_logger
-from cryptotrader.services.unified_clients.binanceRestUnifiedClient import BinanceRestUnifiedClient
+from cryptotrader.services.unified_clients.binanceRestUnifiedClient import (
+    BinanceRestUnifiedClient,
+    get_binance_client,
+)
 
 logger = get_logger(__name__)
 
+@lru_cache(maxsize=4096)
+def _format_second(seconds: int) -> str:
+    return datetime.fromtimestamp(seconds).strftime("%Y-%m-%d %H:%M:%S")
+
+def format_trade_time(timestamp_ms: float) -> str:
+    """Format a trade's millisecond timestamp as local date and time.
+
+    Results are cached per second, so trades arriving in the same second
+    share one strftime call.
+    """
+    return _format_second(int(timestamp_ms // 1000))
+
+# Bound once; str.format accepts ints and floats alike, so no float() call
+_format_amount = "{:.8f}".format
+
+def format_trade_amount(value) -> str:
+    """Format a trade price or quantity with 8 decimals; other values as str."""
+    if isinstance(value, (int, float)):
+        return _format_amount(value)
+    return str(value)
+
 class TradeHistoryLogic:
     """Business logic for fetching trade history and calculating PNL."""
 
     def __init__(self, client: Optional[BinanceRestUnifiedClient] = None):
-        # Use provided client or default to BinanceRestUnifiedClient
-        self.client = client or BinanceRestUnifiedClient()
+        # Use provided client or default to the shared BinanceRestUnifiedClient
+        self.client = client or get_binance_client()
 
     def fetch_trades(self, symbol: str) -> List[dict]:
         """Fetch past trades for a symbol using Binance API."""
@@ -29,18 +56,21 @@ class TradeHistoryLogic:
             return []
 
     def calculate_pnl(self, trades: List[dict]) -> float:
-        """Calculate realized PNL from a list of trades."""
-        total_cost = 0.0
-        total_revenue = 0.0
+        """Calculate realized PNL from a list of trades.
+
+        Binance reports qty, price and commission as decimal strings, so they are
+        summed as Decimal to keep the total exact however many trades there are.
+        """
+        pnl = Decimal(0)
         for trade in trades:
-            qty = float(trade.get("qty", 0))
-            price = float(trade.get("price", 0))
-            commission = float(trade.get("commission", 0))
+            notional = Decimal(str(trade.get("qty", 0))) * Decimal(
+                str(trade.get("price", 0))
+            )
+            commission = Decimal(str(trade.get("commission", 0)))
             # isBuyer indicates a buy trade
             if trade.get("isBuyer", False):
-                total_cost += (qty * price) + commission
+                pnl -= notional + commission
             else:
-                total_revenue += (qty * price) - commission
-        pnl = total_revenue - total_cost
+                pnl += notional - commission
         logger.info(f"Calculated PNL: {pnl:.2f}")
-        return pnl
+        return float(pnl)
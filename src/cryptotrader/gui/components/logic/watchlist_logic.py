@@ -5,19 +5,52 @@ Watchlist Logic
 Handles symbol validation, searching, and fetching price updates using the Unified Client.
 """
 
-from typing import Callable, Optional, List
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, FrozenSet, Optional, List, Tuple
 from cryptotrader.config import get_logger
-from cryptotrader.services.unified_clients.binanceRestUnifiedClient import BinanceRestUnifiedClient
+from cryptotrader.services.unified_clients.binanceRestUnifiedClient import (
+    BinanceRestUnifiedClient,
+    get_binance_client,
+)
 
 logger = get_logger(__name__)
 
+# Seconds before the cached symbol list is refetched
+SYMBOLS_TTL = 300.0
+
+# Ticker requests allowed in flight at once, to stay well inside Binance limits
+MAX_CONCURRENT_REQUESTS = 10
+
 
 class WatchlistLogic:
     """Business logic for symbol validation, lookup, and price updates."""
 
     def __init__(self, client: Optional[BinanceRestUnifiedClient] = None):
-        # Use provided client or default to BinanceRestUnifiedClient
-        self.client = client or BinanceRestUnifiedClient()
+        # Use provided client or default to the shared BinanceRestUnifiedClient
+        self.client = client or get_binance_client()
+        # Symbol list shared by search and validation, refetched after SYMBOLS_TTL
+        self._symbols_cache: Optional[FrozenSet[str]] = None
+        self._symbols_sorted: Tuple[str, ...] = ()
+        self._symbols_cache_time = 0.0
+        # Event loop running in a daemon thread, created on the first batch fetch
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _symbols(self) -> FrozenSet[str]:
+        """Return the cached set of Binance symbols, refetching it once stale."""
+        now = time.monotonic()
+        if self._symbols_cache is None or now - self._symbols_cache_time > SYMBOLS_TTL:
+            self._symbols_cache = frozenset(self.client.get_binance_symbols())
+            # Sorted once per refresh so searches can return matches in order
+            self._symbols_sorted = tuple(sorted(self._symbols_cache))
+            self._symbols_cache_time = now
+        return self._symbols_cache
+
+    def refresh_symbols(self) -> None:
+        """Drop the cached symbol list, e.g. after reconnecting."""
+        self._symbols_cache = None
 
     def fetch_symbol_data(self, symbol: str, callback: Callable[[str, dict], None]) -> None:
         """Fetch latest bid/ask prices for a symbol and invoke the callback."""
@@ -30,15 +63,46 @@ class WatchlistLogic:
         except Exception as e:
             logger.error(f"Error fetching ticker data for {symbol}: {e}")
 
+    async def fetch_symbols_data_async(self, symbols: List[str]) -> Dict[str, dict]:
+        """Fetch tickers for all symbols concurrently, keyed by symbol."""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def fetch(symbol: str) -> Tuple[str, Optional[dict]]:
+            async with semaphore:
+                try:
+                    return symbol, await self.client.get_24h_ticker_price_async(symbol)
+                except Exception as e:
+                    logger.error(f"Error fetching ticker data for {symbol}: {e}")
+                    return symbol, None
+
+        results = await asyncio.gather(*(fetch(symbol) for symbol in symbols))
+        tickers = {symbol: ticker for symbol, ticker in results if ticker}
+        for symbol in symbols:
+            if symbol not in tickers:
+                logger.warning(f"No ticker data returned for {symbol}")
+        return tickers
+
+    def fetch_symbols_data(self, symbols: List[str]) -> "Future[Dict[str, dict]]":
+        """
+        Start fetch_symbols_data_async on the background loop and return at once.
+
+        The returned Future can be polled from the Tk main loop with done(), so
+        the GUI never waits on the network.
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        return asyncio.run_coroutine_threadsafe(
+            self.fetch_symbols_data_async(symbols), self._loop
+        )
+
     def search_symbols(self, query: str) -> List[str]:
         """Return a sorted list of symbols containing the query substring (case-insensitive)."""
         try:
-            # Retrieves a Set[str] of symbols from unified client
-            all_syms = self.client.get_binance_symbols()
+            self._symbols()
             q = query.strip().upper()
-            # Filter symbols by substring match
-            matches = [sym for sym in all_syms if q in sym]
-            return sorted(matches)
+            # Filter the pre-sorted symbols by substring match; order is kept
+            return [sym for sym in self._symbols_sorted if q in sym]
         except Exception as e:
             logger.error(f"Error searching symbols for query '{query}': {e}")
             return []
@@ -46,8 +110,8 @@ class WatchlistLogic:
     def validate_symbol(self, symbol: str) -> bool:
         """Check if the exact symbol exists on Binance."""
         try:
-            # Exact membership check against Set[str]
-            return symbol.strip().upper() in self.client.get_binance_symbols()
+            # Exact membership check against the cached symbol set
+            return symbol.strip().upper() in self._symbols()
         except Exception as e:
             logger.error(f"Error validating symbol '{symbol}': {e}")
             return False
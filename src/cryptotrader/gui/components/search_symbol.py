@@ -6,16 +6,19 @@ A reusable component for searching and selecting trading symbols.
 
 import tkinter as tk
 from tkinter import ttk
-from typing import List, Set, Callable, Optional
-import re
+from typing import Dict, FrozenSet, List, Callable, Optional
+import json
+import queue
+import tempfile
 import threading
+import time
 import os
 import sys
 from pathlib import Path
 
 from cryptotrader.config import get_logger
 from cryptotrader.services.unified_clients.binanceRestUnifiedClient import (
-    BinanceRestUnifiedClient,
+    get_binance_client,
 )
 from cryptotrader.gui.components.styles import Colors
 
@@ -25,18 +28,109 @@ if str(project_root) not in sys.path:
 
 logger = get_logger(__name__)
 
+# Milliseconds of typing pause before the symbol filter runs
+_SEARCH_DEBOUNCE_MS = 80
+# Milliseconds between checks for the background symbol load
+_LOAD_POLL_MS = 50
+
+# On-disk copy of the trading symbols, used at startup while it is fresh
+_SYMBOL_CACHE_PATH = Path.home() / ".cache" / "cryptotrader" / "binance_symbols.json"
+_SYMBOL_CACHE_TTL = 3600  # seconds
+
+# Every substring up to this length is indexed; longer queries are narrowed
+# through the index entry for their first _INDEXED_SUBSTRING_LEN characters
+_INDEXED_SUBSTRING_LEN = 4
+
+
+def _load_cached_symbols() -> Optional[List[str]]:
+    """Return the symbols cached on disk, or None if missing or stale.
+
+    The cache is written already sorted, so the list is used as is.
+    """
+    try:
+        if time.time() - _SYMBOL_CACHE_PATH.stat().st_mtime > _SYMBOL_CACHE_TTL:
+            return None
+        with open(_SYMBOL_CACHE_PATH, "r", encoding="utf-8") as f:
+            # Interned, like freshly fetched symbols
+            symbols = [sys.intern(symbol) for symbol in json.load(f)]
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable symbol cache: {str(e)}")
+        return None
+    return symbols or None
+
+
+def _save_cached_symbols(symbols: List[str]):
+    """Atomically write the sorted symbols to the disk cache."""
+    try:
+        _SYMBOL_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=_SYMBOL_CACHE_PATH.parent, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(symbols, f)
+            os.replace(tmp_path, _SYMBOL_CACHE_PATH)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning(f"Could not write symbol cache: {str(e)}")
+
+
+def _touch_cached_symbols():
+    """Restart the disk cache TTL without rewriting its contents."""
+    try:
+        os.utime(_SYMBOL_CACHE_PATH)
+    except OSError as e:
+        logger.warning(f"Could not refresh symbol cache: {str(e)}")
+
 
 class SymbolSearchLogic:
     """Business logic for symbol searching and filtering."""
 
+    _instance: Optional["SymbolSearchLogic"] = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "SymbolSearchLogic":
+        """Return the process-wide logic, creating it on first use.
+
+        Every search widget shares it, so the symbols are fetched and indexed
+        once however many widgets are open.
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
     def __init__(self):
         """Initialize the symbol search logic."""
-        self.client = BinanceRestUnifiedClient()
+        self.client = get_binance_client()
         self.available_symbols: List[str] = []
-        self.filtered_symbols: List[str] = []
-        self.on_symbols_updated: Set[Callable[[List[str]], None]] = set()
-        self.on_filtered_symbols_updated: Set[Callable[[List[str]], None]] = set()
+        self.available_symbols_set: FrozenSet[str] = frozenset()
+        # substring -> symbols containing it, in available_symbols order
+        self._substring_index: Dict[str, List[str]] = {}
+        # Last query and the symbols containing it, to narrow refined queries.
+        # Shared by all widgets; a query from another widget only costs a miss
+        self._last_query = ""
+        self._last_matches: List[str] = []
+        # Listeners are called in registration order
+        self.on_symbols_updated: List[Callable[[List[str]], None]] = []
         self.is_initialized: bool = False
+        # Symbol list handed from the fetch thread to the Tk thread
+        self._loaded: "queue.SimpleQueue[List[str]]" = queue.SimpleQueue()
+        # True until the fetch thread has queued its last result
+        self._fetching: bool = True
+
+        # Start from the disk cache so the search works before the network
+        # answers, then refresh from the exchange in the background
+        cached = _load_cached_symbols()
+        if cached:
+            self._set_available_symbols(cached)
+            self.is_initialized = True
+            logger.info(f"Loaded {len(cached)} trading symbols from cache")
 
         # Fetch symbols asynchronously
         self._initialize_async()
@@ -48,113 +142,160 @@ class SymbolSearchLogic:
         thread.start()
 
     def _fetch_symbols(self):
-        """Fetch available symbols from the exchange."""
+        """Fetch available symbols from the exchange.
+
+        Runs on the fetch thread, so it only queues the result; listeners are
+        notified from the Tk thread by process_pending().
+        """
         try:
-            # Get exchange info from system operations
-            system_client = (
-                self.client.system if hasattr(self.client, "system") else None
-            )
-            if system_client:
-                exchange_info = system_client.getExchangeInfo()
-            else:
-                # Fallback to market client for exchange info
-                exchange_info = self.client.market.getExchangeInfo()
-
-            if exchange_info and "symbols" in exchange_info:
-                symbols = [
-                    symbol["symbol"]
-                    for symbol in exchange_info["symbols"]
-                    if symbol.get("status") == "TRADING"
-                ]
-
-                if symbols:
-                    self.available_symbols = sorted(symbols)
-                    self.filtered_symbols = self.available_symbols
-                    self._notify_symbols_updated()
-                    self._notify_filtered_symbols_updated()
-                    self.is_initialized = True
-                    logger.info(f"Loaded {len(symbols)} trading symbols")
+            self._fetch_symbols_from_exchange()
+        finally:
+            self._fetching = False
+
+    def _fetch_symbols_from_exchange(self):
+        """Queue the exchange's trading symbols, falling back if unavailable."""
+        try:
+            # Symbols in TRADING status, parsed from the cached exchangeInfo
+            symbols = self.client.get_binance_symbols(only_trading=True)
+
+            if symbols:
+                if symbols == self.available_symbols_set:
+                    # Same as the cached load: skip the sort, re-index and
+                    # rewrite, and just mark the cache fresh again
+                    _touch_cached_symbols()
+                    logger.info("Cached trading symbols are up to date")
                     return
 
+                # Sorted here, off the Tk thread; the cache stores this order.
+                # Interned so the list, set, index and listbox share one
+                # string per symbol
+                symbols = sorted(map(sys.intern, symbols))
+                self._loaded.put(symbols)
+                _save_cached_symbols(symbols)
+                logger.info(f"Loaded {len(symbols)} trading symbols")
+                return
+
             logger.warning("Failed to fetch symbols from exchange")
         except Exception as e:
             logger.error(f"Error fetching symbols: {str(e)}")
 
-        # If we get here, there was an error - use fallback
-        self.available_symbols = ["BTCUSDT", "ETHUSDT", "BNBUSDT", "SOLUSDT", "ADAUSDT"]
-        self.filtered_symbols = self.available_symbols
-        self._notify_symbols_updated()
-        self._notify_filtered_symbols_updated()
-        self.is_initialized = True
+        # If we get here, there was an error - keep the cached symbols if we
+        # started from them, otherwise use the fallback
+        if not self.is_initialized:
+            self._loaded.put(["ADAUSDT", "BNBUSDT", "BTCUSDT", "ETHUSDT", "SOLUSDT"])
+
+    def process_pending(self) -> bool:
+        """Apply a finished background symbol load and notify listeners.
+
+        Must be called from the Tk thread, since listeners update widgets.
 
-    def filter_symbols(self, search_text: str):
-        """Filter symbols based on search text."""
+        Returns:
+            True while the background fetch may still deliver symbols
+        """
+        # Read before draining so a result queued just before the fetch
+        # thread finishes is never left behind
+        fetching = self._fetching
+        symbols = None
+        while True:
+            try:
+                symbols = self._loaded.get_nowait()
+            except queue.Empty:
+                break
+
+        if symbols is not None:
+            self._set_available_symbols(symbols)
+            self.is_initialized = True
+            self._notify_symbols_updated()
+        return fetching
+
+    def _set_available_symbols(self, symbols: List[str]):
+        """Store the sorted symbol list and rebuild the search index."""
+        self.available_symbols = symbols
+        self.available_symbols_set = frozenset(symbols)
+
+        index: Dict[str, List[str]] = {}
+        for symbol in symbols:
+            substrings = {
+                symbol[start : start + length]
+                for length in range(1, _INDEXED_SUBSTRING_LEN + 1)
+                for start in range(len(symbol) - length + 1)
+            }
+            for substring in substrings:
+                index.setdefault(substring, []).append(symbol)
+        self._substring_index = index
+        self._last_query = ""
+        self._last_matches = []
+
+    def _symbols_containing(
+        self, search_text: str, limit: Optional[int] = None
+    ) -> List[str]:
+        """Look up the symbols containing search_text in the substring index.
+
+        When the query extends the previous one (typing "BT" -> "BTC"), its
+        matches are a subset of the previous matches, so the smaller of that
+        list and the index entry is scanned. With a limit the scan stops after
+        that many matches; a cut-off list is not reused for refinement.
+        """
+        candidates = self._substring_index.get(
+            search_text[:_INDEXED_SUBSTRING_LEN], []
+        )
+        refined = (
+            self._last_query
+            and self._last_query in search_text
+            and len(self._last_matches) < len(candidates)
+        )
+        if refined:
+            candidates = self._last_matches
+        if not (refined or len(search_text) > _INDEXED_SUBSTRING_LEN):
+            # The index entry is the exact match list
+            self._last_query = search_text
+            self._last_matches = candidates
+            return candidates[:limit]
+
+        matches = []
+        for s in candidates:
+            if search_text in s:
+                matches.append(s)
+                if limit and len(matches) >= limit:
+                    break
+
+        complete = not limit or len(matches) < limit
+        self._last_query = search_text if complete else ""
+        self._last_matches = matches if complete else []
+        return matches
+
+    def filter_symbols(
+        self, search_text: str, limit: Optional[int] = None
+    ) -> List[str]:
+        """Filter symbols based on search text.
+
+        The logic is shared between widgets, so the matches are returned to
+        the caller rather than stored on the instance.
+
+        Args:
+            search_text: Text to match against the symbols
+            limit: Stop collecting matches after this many, if given
+
+        Returns:
+            The matching symbols
+        """
         if not search_text:
-            self.filtered_symbols = self.available_symbols
-        else:
-            # Convert to uppercase for case-insensitive search
-            search_text = search_text.upper()
-
-            # First try exact match
-            exact_matches = [s for s in self.available_symbols if search_text == s]
-            if exact_matches:
-                self.filtered_symbols = exact_matches
-            else:
-                # Then try contains match
-                self.filtered_symbols = [
-                    s for s in self.available_symbols if search_text in s
-                ]
-
-                # If still no matches, try searching for base currencies and quote currencies
-                if not self.filtered_symbols:
-                    # Split trading pairs into base and quote currency
-                    # For example, BTCUSDT -> BTC (base) and USDT (quote)
-                    base_matches = []
-                    quote_matches = []
-
-                    # Common quote currencies to help split the pairs correctly
-                    quote_currencies = [
-                        "USDT",
-                        "BTC",
-                        "ETH",
-                        "BNB",
-                        "BUSD",
-                        "USD",
-                        "EUR",
-                    ]
-
-                    for symbol in self.available_symbols:
-                        # Find quote currency
-                        quote = None
-                        for q in quote_currencies:
-                            if symbol.endswith(q):
-                                quote = q
-                                base = symbol[: -len(q)]
-                                break
-
-                        # If no known quote currency, assume last 3-4 chars
-                        if not quote:
-                            if len(symbol) > 4:
-                                quote = symbol[-4:]
-                                base = symbol[:-4]
-                            else:
-                                base = symbol[:-3]
-                                quote = symbol[-3:]
-
-                        # Check if search matches base or quote
-                        if search_text in base:
-                            base_matches.append(symbol)
-                        elif search_text in quote:
-                            quote_matches.append(symbol)
-
-                    # Combine results, prioritizing base matches
-                    self.filtered_symbols = base_matches + quote_matches
-
-        self._notify_filtered_symbols_updated()
+            return self.available_symbols[:limit]
+
+        # Convert to uppercase for case-insensitive search
+        search_text = search_text.upper()
+        # First try exact match
+        if search_text in self.available_symbols_set:
+            return [search_text]
+
+        # Then try contains match. Base and quote currencies are substrings
+        # of the symbol, so matching them separately cannot find anything more
+        return self._symbols_containing(search_text, limit)
 
     def register_symbols_listener(self, callback: Callable[[List[str]], None]):
         """Register a listener for all symbols updates."""
-        self.on_symbols_updated.add(callback)
+        if callback not in self.on_symbols_updated:
+            self.on_symbols_updated.append(callback)
         if self.is_initialized:
             callback(self.available_symbols)
 
@@ -171,35 +312,14 @@ class SymbolSearchLogic:
             except Exception as e:
                 logger.error(f"Error notifying symbol listener: {str(e)}")
 
-    def register_filtered_symbols_listener(self, callback: Callable[[List[str]], None]):
-        """Register a listener for filtered symbols updates."""
-        self.on_filtered_symbols_updated.add(callback)
-        if self.is_initialized:
-            callback(self.filtered_symbols)
-
-    def unregister_filtered_symbols_listener(
-        self, callback: Callable[[List[str]], None]
-    ):
-        """Unregister a filtered symbols listener."""
-        if callback in self.on_filtered_symbols_updated:
-            self.on_filtered_symbols_updated.remove(callback)
-
-    def _notify_filtered_symbols_updated(self):
-        """Notify listeners about filtered symbols update."""
-        for callback in self.on_filtered_symbols_updated:
-            try:
-                callback(self.filtered_symbols)
-            except Exception as e:
-                logger.error(f"Error notifying filtered symbol listener: {str(e)}")
+    def contains(self, symbol: str) -> bool:
+        """Check whether the symbol is one of the available symbols."""
+        return symbol in self.available_symbols_set
 
     def get_all_symbols(self) -> List[str]:
         """Get all available symbols."""
         return self.available_symbols
 
-    def get_filtered_symbols(self) -> List[str]:
-        """Get the filtered symbols."""
-        return self.filtered_symbols
-
 
 class SymbolSearchWidget(ttk.Frame):
     """Widget for searching and selecting trading symbols."""
@@ -212,6 +332,7 @@ class SymbolSearchWidget(ttk.Frame):
         width: int = 25,
         show_add_button: bool = True,
         max_displayed: int = 10,
+        logic: Optional[SymbolSearchLogic] = None,
     ):
         """Initialize the symbol search widget.
 
@@ -222,6 +343,7 @@ class SymbolSearchWidget(ttk.Frame):
             width: Width of the search entry widget
             show_add_button: Whether to show the Add button
             max_displayed: Maximum number of symbols to display in dropdown
+            logic: Symbol search logic to use, the shared instance by default
         """
         super().__init__(parent)
 
@@ -231,14 +353,31 @@ class SymbolSearchWidget(ttk.Frame):
         self.show_add_button = show_add_button
         self.max_displayed = max_displayed
 
-        # Create the logic component
-        self.logic = SymbolSearchLogic()
+        # after() id of the pending debounced filter, if any
+        self._pending_after: Optional[str] = None
+        # after() id of the next symbol load poll, if any
+        self._poll_after: Optional[str] = None
+        # Listbox height last applied, so unchanged heights aren't reconfigured
+        self._last_height = max_displayed
+
+        # Symbols matching this widget's current search
+        self.filtered_symbols: List[str] = []
+
+        # Shared logic component
+        self.logic = logic or SymbolSearchLogic.instance()
 
         # Initialize UI
         self.init_ui()
 
-        # Register for symbol updates
-        self.logic.register_filtered_symbols_listener(self._update_dropdown)
+        # Re-run this widget's search whenever the symbols (re)load
+        self.logic.register_symbols_listener(self._on_symbols_loaded)
+        self._poll_after = self.after(_LOAD_POLL_MS, self._poll_symbols)
+
+    def _poll_symbols(self):
+        """Apply the background symbol load on the Tk thread once it finishes."""
+        self._poll_after = None
+        if self.logic.process_pending():
+            self._poll_after = self.after(_LOAD_POLL_MS, self._poll_symbols)
 
     def init_ui(self):
         """Initialize the UI components."""
@@ -254,8 +393,13 @@ class SymbolSearchWidget(ttk.Frame):
         self.search_var = tk.StringVar()
         self.search_var.trace_add("write", self._on_search_changed)
 
+        # Typed and pasted text is upper-cased before it reaches search_var
         self.search_entry = ttk.Entry(
-            search_frame, textvariable=self.search_var, width=self.width
+            search_frame,
+            textvariable=self.search_var,
+            width=self.width,
+            validate="key",
+            validatecommand=(self.register(self._validate_upper), "%d", "%i", "%S"),
         )
         self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=2)
 
@@ -304,22 +448,50 @@ class SymbolSearchWidget(ttk.Frame):
         self.search_entry.bind("<FocusOut>", self._on_focus_out)
         self.dropdown.bind("<FocusOut>", self._on_focus_out)
 
+        # Release the logic's reference to this widget when it is destroyed
+        self.bind("<Destroy>", self._cleanup)
+
+    def _validate_upper(self, action: str, index: str, text: str) -> bool:
+        """Insert typed or pasted text upper-cased in place of the original.
+
+        Inserting from the validatecommand makes ttk reject the original
+        edit, so search_var is written once per keystroke.
+        """
+        if action == "1" and text != text.upper():
+            self.search_entry.insert(int(index), text.upper())
+            return False
+        return True
+
     def _on_search_changed(self, *args):
         """Handle search text changes."""
         search_text = self.search_var.get()
 
-        # Convert to uppercase for consistency
-        if search_text and not search_text.isupper():
-            # Only modify if the text is not already uppercase
-            # to avoid an infinite loop from trace events
-            self.search_var.set(search_text.upper())
-            return
+        # Debounce so a burst of keystrokes filters only once
+        if self._pending_after:
+            self.after_cancel(self._pending_after)
+        self._pending_after = self.after(
+            _SEARCH_DEBOUNCE_MS, self._do_filter, search_text
+        )
 
-        # Filter symbols
-        self.logic.filter_symbols(search_text)
+    def _on_symbols_loaded(self, symbols: List[str]):
+        """Refresh the dropdown contents for the newly loaded symbols."""
+        self._apply_filter(self.search_var.get())
+
+    def _apply_filter(self, search_text: str):
+        """Filter symbols and put the matches in the dropdown."""
+        # Fetch a few extra matches beyond what the dropdown shows
+        self.filtered_symbols = self.logic.filter_symbols(
+            search_text, limit=self.max_displayed * 3
+        )
+        self._update_dropdown(self.filtered_symbols)
+
+    def _do_filter(self, search_text: str):
+        """Filter symbols for the settled search text and update the dropdown."""
+        self._pending_after = None
+        self._apply_filter(search_text)
 
         # Show dropdown if we have search results
-        if self.logic.get_filtered_symbols():
+        if self.filtered_symbols:
             self._show_dropdown()
         else:
             self._hide_dropdown()
@@ -329,15 +501,16 @@ class SymbolSearchWidget(ttk.Frame):
         # Clear current items
         self.dropdown.delete(0, tk.END)
 
-        # Add filtered symbols, limiting to max_displayed
+        # Add filtered symbols, limiting to max_displayed, in a single Tcl call
         display_symbols = symbols[: self.max_displayed]
-        for symbol in display_symbols:
-            self.dropdown.insert(tk.END, symbol)
+        if display_symbols:
+            self.dropdown.insert(tk.END, *display_symbols)
 
         # Update dropdown size
-        visible_count = min(len(display_symbols), self.max_displayed)
-        if visible_count > 0:
+        visible_count = len(display_symbols)
+        if visible_count > 0 and visible_count != self._last_height:
             self.dropdown.config(height=visible_count)
+            self._last_height = visible_count
 
     def _show_dropdown(self, event=None):
         """Show the dropdown list."""
@@ -381,7 +554,7 @@ class SymbolSearchWidget(ttk.Frame):
         symbol = self.search_var.get()
 
         # Validate symbol
-        if symbol and symbol in self.logic.get_all_symbols():
+        if symbol and self.logic.contains(symbol):
             # Call add callback
             if self.on_add:
                 self.on_add(symbol)
@@ -426,7 +599,7 @@ class SymbolSearchWidget(ttk.Frame):
                 self.on_select(symbol)
 
         # If no dropdown or empty, try to add the symbol
-        elif self.show_add_button and symbol and symbol in self.logic.get_all_symbols():
+        elif self.show_add_button and symbol and self.logic.contains(symbol):
             if self.on_add:
                 self.on_add(symbol)
                 self.search_var.set("")  # Clear input after adding
@@ -462,10 +635,19 @@ class SymbolSearchWidget(ttk.Frame):
 
     def set_selected_symbol(self, symbol: str):
         """Set the selected symbol."""
-        self.search_var.set(symbol)
+        self.search_var.set(symbol.upper())
+
+    def _cleanup(self, event):
+        """Cancel pending callbacks and unregister listeners on destroy."""
+        # <Destroy> is also delivered for child widgets
+        if event.widget is not self or self.logic is None:
+            return
+
+        for after_id in (self._pending_after, self._poll_after):
+            if after_id:
+                self.after_cancel(after_id)
+        self._pending_after = None
+        self._poll_after = None
 
-    def __del__(self):
-        """Clean up resources."""
-        # Unregister listeners when widget is destroyed
-        if hasattr(self, "logic"):
-            self.logic.unregister_filtered_symbols_listener(self._update_dropdown)
+        self.logic.unregister_symbols_listener(self._on_symbols_loaded)
+        self.logic = None
@@ -12,35 +12,76 @@ Allows users to configure and execute trading strategies.
 
 import tkinter as tk
 from tkinter import ttk
+from dataclasses import dataclass
 from functools import partial
+from itertools import count
 
 from cryptotrader.config import get_logger
 from cryptotrader.gui.components.styles import Colors, create_table
 
 logger = get_logger(__name__)
 
+# Display columns edited in place -> the StrategyRow field they hold
+_EDITABLE_COLUMNS = {"#1": "strategy", "#2": "symbol", "#3": "timeframe"}
+_PARAMETERS_COLUMN = "#7"
+_STATUS_COLUMN = "#8"
+_ACTIONS_COLUMN = "#9"
+
+# Available strategy types and timeframes
+STRATEGY_TYPES = ("Technical", "Breakout")
+TIMEFRAMES = ("1m", "5m", "15m", "30m", "1h", "4h", "1d")
+
+# Strategy type -> (parameters it needs, error logged when any is missing)
+_REQUIRED_PARAMS = {
+    "Technical": (
+        frozenset({"ema_fast", "ema_slow", "ema_signal"}),
+        "Missing required MACD parameters",
+    ),
+    "Breakout": (frozenset({"min_volume"}), "Missing minimum volume parameter"),
+}
+
 
 class StrategyParametersDialog(tk.Toplevel):
-    """Dialog for configuring strategy parameters."""
+    """Dialog for configuring strategy parameters.
+
+    The dialog is built once, hidden, and reused: open() fills in the
+    parameters and shows it modally, and closing it only withdraws it.
+    """
 
-    def __init__(self, parent, strategy_type, parameters=None):
+    def __init__(self, parent, strategy_type):
         super().__init__(parent)
+        self.withdraw()
 
         self.strategy_type = strategy_type
-        self.parameters = parameters or {}
+        self.parameters = {}
         self.result = None
+        # Set when the dialog is closed, ending the wait in open()
+        self._closed = tk.BooleanVar(self, value=False)
 
         self.title(f"{strategy_type} Strategy Parameters")
         self.geometry("400x250")
         self.configure(background=Colors.BACKGROUND)
-
-        # Make dialog modal
         self.transient(parent)
-        self.grab_set()
+        self.protocol("WM_DELETE_WINDOW", self.on_cancel)
 
         self.init_ui()
 
-        # Center the dialog
+    def open(self, parameters=None):
+        """Show the dialog modally and return the chosen parameters.
+
+        Args:
+            parameters: Current parameter values; unset ones use defaults
+
+        Returns:
+            The configured parameters, or None if the dialog was cancelled
+        """
+        self.parameters = parameters or {}
+        self.result = None
+        for name, widget in self.param_widgets.items():
+            widget.set(self.parameters.get(name, self.param_defaults[name]))
+
+        # Show and center the dialog
+        self.deiconify()
         self.update_idletasks()
         width = self.winfo_width()
         height = self.winfo_height()
@@ -48,8 +89,19 @@ class StrategyParametersDialog(tk.Toplevel):
         y = (self.winfo_screenheight() // 2) - (height // 2)
         self.geometry("{}x{}+{}+{}".format(width, height, x, y))
 
-        # Wait for window to be closed
-        self.wait_window(self)
+        # Make dialog modal
+        self.grab_set()
+
+        # Wait for the dialog to be closed
+        self._closed.set(False)
+        self.wait_variable(self._closed)
+        return self.result
+
+    def _close(self):
+        """Hide the dialog for reuse and end the wait in open()."""
+        self.grab_release()
+        self.withdraw()
+        self._closed.set(True)
 
     def init_ui(self):
         """Initialize the UI components."""
@@ -61,8 +113,9 @@ class StrategyParametersDialog(tk.Toplevel):
         form_frame = ttk.LabelFrame(main_frame, text="Parameters", padding=10)
         form_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        # Parameter input widgets
+        # Parameter input widgets and the values they start from
         self.param_widgets = {}
+        self.param_defaults = {}
 
         # Add different parameters based on strategy type
         row = 0
@@ -74,7 +127,7 @@ class StrategyParametersDialog(tk.Toplevel):
             self.param_widgets["ema_fast"] = ttk.Spinbox(
                 form_frame, from_=3, to=50, width=10
             )
-            self.param_widgets["ema_fast"].set(self.parameters.get("ema_fast", 12))
+            self.param_defaults["ema_fast"] = 12
             self.param_widgets["ema_fast"].grid(
                 row=row, column=1, sticky="w", padx=5, pady=5
             )
@@ -86,7 +139,7 @@ class StrategyParametersDialog(tk.Toplevel):
             self.param_widgets["ema_slow"] = ttk.Spinbox(
                 form_frame, from_=10, to=100, width=10
             )
-            self.param_widgets["ema_slow"].set(self.parameters.get("ema_slow", 26))
+            self.param_defaults["ema_slow"] = 26
             self.param_widgets["ema_slow"].grid(
                 row=row, column=1, sticky="w", padx=5, pady=5
             )
@@ -98,7 +151,7 @@ class StrategyParametersDialog(tk.Toplevel):
             self.param_widgets["ema_signal"] = ttk.Spinbox(
                 form_frame, from_=2, to=20, width=10
             )
-            self.param_widgets["ema_signal"].set(self.parameters.get("ema_signal", 9))
+            self.param_defaults["ema_signal"] = 9
             self.param_widgets["ema_signal"].grid(
                 row=row, column=1, sticky="w", padx=5, pady=5
             )
@@ -112,7 +165,7 @@ class StrategyParametersDialog(tk.Toplevel):
             self.param_widgets["min_volume"] = ttk.Spinbox(
                 form_frame, from_=0, to=100000, increment=10, width=10
             )
-            self.param_widgets["min_volume"].set(self.parameters.get("min_volume", 100))
+            self.param_defaults["min_volume"] = 100
             self.param_widgets["min_volume"].grid(
                 row=row, column=1, sticky="w", padx=5, pady=5
             )
@@ -133,12 +186,12 @@ class StrategyParametersDialog(tk.Toplevel):
         """Handle OK button click."""
         # Get values from parameter widgets
         self.result = self.get_parameters()
-        self.destroy()
+        self._close()
 
     def on_cancel(self):
         """Handle Cancel button click."""
         self.result = None
-        self.destroy()
+        self._close()
 
     def get_parameters(self):
         """Get the configured parameters."""
@@ -155,6 +208,25 @@ class StrategyParametersDialog(tk.Toplevel):
         return result
 
 
+@dataclass(slots=True)
+class StrategyRow:
+    """Settings of one strategy row.
+
+    Values are plain strings rather than tk.StringVar, so the table is
+    refreshed without reading each value back through Tcl.
+    """
+
+    strategy: str
+    symbol: str
+    timeframe: str = "1h"
+    balance: str = "10"
+    tp: str = "2"
+    sl: str = "1"
+    status: str = "INACTIVE"
+    is_active: bool = False
+    item_id: str = ""
+
+
 class StrategyPanel(ttk.Frame):
     """Widget for configuring and running trading strategies."""
 
@@ -165,13 +237,24 @@ class StrategyPanel(ttk.Frame):
         self.available_symbols = []
         self.active_strategies = {}
         self.strategy_parameters = {}
+        # Row ids are never reused, so a deleted row's id cannot collide
+        # with a later one
+        self._row_ids = count()
+        # Treeview item id -> row id, to find the row under a click
+        self._row_by_item = {}
+        # (row id, display column) of the cell being edited, if any
+        self._editing = None
+        # Strategy type -> its parameters dialog, kept hidden between uses
+        self._param_dialogs = {}
+        # Row id -> display columns changed since the last table refresh,
+        # and whether a refresh is queued
+        self._dirty_rows = {}
+        self._refresh_pending = False
         self.log_callback = None  # Callback for logging messages
 
-        # Available strategy types
-        self.strategy_types = ["Technical", "Breakout"]
-
-        # Available timeframes
-        self.timeframes = ["1m", "5m", "15m", "30m", "1h", "4h", "1d"]
+        # Available strategy types and timeframes
+        self.strategy_types = STRATEGY_TYPES
+        self.timeframes = TIMEFRAMES
 
         self.init_ui()
 
@@ -206,6 +289,26 @@ class StrategyPanel(ttk.Frame):
         table_frame, self.table = create_table(self, columns, height=10)
         table_frame.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
 
+        # Row colors by strategy status
+        self.table.tag_configure("active", foreground=Colors.SUCCESS)
+        self.table.tag_configure("inactive", foreground=Colors.FOREGROUND)
+
+        # One cell editor and one actions menu serve every row; the editor
+        # is only placed over a cell while it is being edited
+        self._editor = ttk.Combobox(self.table, width=10)
+        self._editor.bind("<<ComboboxSelected>>", self._commit_edit)
+        self._editor.bind("<Return>", self._commit_edit)
+        self._editor.bind("<Escape>", self._cancel_edit)
+        self._editor.bind("<FocusOut>", self._on_editor_focus_out)
+        self._actions_menu = tk.Menu(self, tearoff=0)
+
+        self.table.bind("<Button-1>", self._on_cell_click)
+        self.table.bind("<Button-3>", self._on_right_click)
+        # A placed editor would drift away from its cell on resize or scroll
+        self.table.bind("<Configure>", self._cancel_edit)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.table.bind(sequence, self._cancel_edit, add="+")
+
     def set_available_symbols(self, symbols):
         """Set the list of available trading symbols."""
         self.available_symbols = sorted(symbols)
@@ -213,68 +316,25 @@ class StrategyPanel(ttk.Frame):
     def add_strategy_row(self):
         """Add a new strategy configuration row to the table."""
         # Create a unique identifier for this row
-        row_id = len(self.strategy_parameters)
+        row_id = next(self._row_ids)
 
-        # Create cells for the row
-        strategy_var = tk.StringVar(value=self.strategy_types[0])
-        symbol_var = tk.StringVar(
-            value=self.available_symbols[0] if self.available_symbols else "BTCUSDT"
+        # Store the settings for this row
+        row = StrategyRow(
+            strategy=self.strategy_types[0],
+            symbol=self.available_symbols[0] if self.available_symbols else "BTCUSDT",
         )
-        timeframe_var = tk.StringVar(value="1h")
-        balance_var = tk.StringVar(value="10")
-        tp_var = tk.StringVar(value="2")
-        sl_var = tk.StringVar(value="1")
-        status_var = tk.StringVar(value="INACTIVE")
-
-        # Store variables for this row
-        self.active_strategies[row_id] = {
-            "strategy_var": strategy_var,
-            "symbol_var": symbol_var,
-            "timeframe_var": timeframe_var,
-            "balance_var": balance_var,
-            "tp_var": tp_var,
-            "sl_var": sl_var,
-            "status_var": status_var,
-            "is_active": False,
-        }
+        self.active_strategies[row_id] = row
 
         # Initialize parameters dictionary for this row
         self.strategy_parameters[row_id] = {}
 
-        # Create the table row
-        values = [
-            strategy_var.get(),
-            symbol_var.get(),
-            timeframe_var.get(),
-            balance_var.get(),
-            tp_var.get(),
-            sl_var.get(),
-            "Not Set",
-            status_var.get(),
-            "",  # Actions column will be populated with buttons
-        ]
-        item_id = self.table.insert("", "end", values=values, tags=(f"row_{row_id}",))
-
-        # Add dropdown cells
-        self._add_combo_to_cell(item_id, 0, strategy_var, self.strategy_types)
-        self._add_combo_to_cell(
-            item_id,
-            1,
-            symbol_var,
-            self.available_symbols or ["BTCUSDT", "ETHUSDT", "BNBUSDT"],
+        # Create the table row, keeping its Treeview item so the row is
+        # updated without searching
+        item_id = self.table.insert(
+            "", "end", values=self._row_values(row_id), tags=("inactive",)
         )
-        self._add_combo_to_cell(item_id, 2, timeframe_var, self.timeframes)
-
-        # Add parameters button
-        self._add_button_to_cell(
-            item_id,
-            6,
-            "Set Params",
-            lambda rid=row_id: self.show_parameters_dialog(rid),
-        )
-
-        # Add action buttons
-        self._add_action_buttons(item_id, row_id)
+        row.item_id = item_id
+        self._row_by_item[item_id] = row_id
 
         # Log the addition
         if self.log_callback:
@@ -282,125 +342,171 @@ class StrategyPanel(ttk.Frame):
                 f"Added new strategy configuration (row {row_id + 1})", "INFO"
             )
 
-    def _add_combo_to_cell(self, item_id, column, variable, values):
-        """Add a combobox to a cell in the table."""
-        # Place a combobox in the cell
-        bbox = self.table.bbox(item_id, f"#{column}")
-        if not bbox:
-            self.update_idletasks()
-            bbox = self.table.bbox(item_id, f"#{column}")
-
-        if bbox:
-            x, y, width, height = bbox
-
-            # Create the combo
-            combo = ttk.Combobox(
-                self.table, textvariable=variable, values=values, width=10
-            )
-            combo.place(x=x, y=y, width=width, height=height)
-
-            # Bind change event
-            combo.bind(
-                "<<ComboboxSelected>>",
-                lambda e, iid=item_id: self._update_table_row_values(iid),
-            )
-
-    def _add_button_to_cell(self, item_id, column, text, command):
-        """Add a button to a cell in the table."""
-        # Place a button in the cell
-        bbox = self.table.bbox(item_id, f"#{column}")
-        if not bbox:
-            self.update_idletasks()
-            bbox = self.table.bbox(item_id, f"#{column}")
+    def _editor_choices(self, field):
+        """Return the values offered when editing a StrategyRow field."""
+        if field == "strategy":
+            return self.strategy_types
+        if field == "symbol":
+            return self.available_symbols or ["BTCUSDT", "ETHUSDT", "BNBUSDT"]
+        return self.timeframes
 
-        if bbox:
-            x, y, width, height = bbox
+    def _on_cell_click(self, event):
+        """Open the editor, parameters dialog or actions menu for a cell."""
+        self._commit_edit()
 
-            # Create the button
-            button = ttk.Button(self.table, text=text, command=command)
-            button.place(x=x, y=y, width=width, height=height)
+        if self.table.identify_region(event.x, event.y) != "cell":
+            return
+        row_id = self._row_by_item.get(self.table.identify_row(event.y))
+        if row_id is None:
+            return
 
-    def _add_action_buttons(self, item_id, row_id):
-        """Add action buttons to the last cell."""
-        # Place buttons in the cell
-        bbox = self.table.bbox(item_id, "#8")  # Actions column
+        column = self.table.identify_column(event.x)
+        if column in _EDITABLE_COLUMNS:
+            self.table.selection_set(self.active_strategies[row_id].item_id)
+            self._start_edit(row_id, column)
+            # Stop the Treeview's own click handling from taking focus
+            # back from the editor
+            return "break"
+        elif column == _PARAMETERS_COLUMN:
+            self.show_parameters_dialog(row_id)
+        elif column == _ACTIONS_COLUMN:
+            self._show_actions_menu(row_id, event.x_root, event.y_root)
+
+    def _on_right_click(self, event):
+        """Show the actions menu for the row under the pointer."""
+        self._commit_edit()
+        row_id = self._row_by_item.get(self.table.identify_row(event.y))
+        if row_id is not None:
+            self._show_actions_menu(row_id, event.x_root, event.y_root)
+
+    def _start_edit(self, row_id, column):
+        """Place the shared combobox over a cell to edit it."""
+        bbox = self.table.bbox(self.active_strategies[row_id].item_id, column)
         if not bbox:
-            self.update_idletasks()
-            bbox = self.table.bbox(item_id, "#8")
-
-        if bbox:
-            x, y, width, height = bbox
-
-            # Create a frame to hold the buttons
-            button_frame = ttk.Frame(self.table)
-            button_frame.place(x=x, y=y, width=width, height=height)
+            return
 
-            # Create toggle button
-            toggle_btn = ttk.Button(
-                button_frame, text="Start", command=lambda: self.toggle_strategy(row_id)
-            )
-            toggle_btn.pack(side=tk.LEFT, padx=2, fill=tk.Y)
+        field = _EDITABLE_COLUMNS[column]
+        x, y, width, height = bbox
+        self._editing = (row_id, column)
+        self._editor.configure(values=self._editor_choices(field))
+        self._editor.set(getattr(self.active_strategies[row_id], field))
+        self._editor.place(x=x, y=y, width=width, height=height)
+        self._editor.focus_set()
+
+    def _commit_edit(self, event=None):
+        """Store the editor's value on its row and hide the editor."""
+        if self._editing is None:
+            return
+        row_id, column = self._editing
+        self._cancel_edit()
+
+        value = self._editor.get()
+        if row_id in self.active_strategies and value:
+            setattr(self.active_strategies[row_id], _EDITABLE_COLUMNS[column], value)
+            self._mark_dirty(row_id, column)
+
+    def _on_editor_focus_out(self, event):
+        """Store the edit once focus has moved on to another widget."""
+        # Focus is only settled once the event has been handled
+        self.after_idle(self._commit_if_focus_left)
+
+    def _commit_if_focus_left(self):
+        """Commit the edit unless focus is still in the editor."""
+        # The drop-down list is a child of the combobox, so opening it is
+        # not leaving the editor. Read the path from Tcl because the list
+        # has no tkinter wrapper for focus_get() to return.
+        focus = str(self.tk.call("focus"))
+        editor = str(self._editor)
+        if focus == editor or focus.startswith(editor + "."):
+            return
+        self._commit_edit()
+
+    def _cancel_edit(self, event=None):
+        """Hide the editor without storing its value."""
+        self._editing = None
+        self._editor.place_forget()
+
+    def _show_actions_menu(self, row_id, x_root, y_root):
+        """Pop up the shared actions menu for a row."""
+        row = self.active_strategies[row_id]
+        menu = self._actions_menu
+        menu.delete(0, tk.END)
+        menu.add_command(
+            label="Stop" if row.is_active else "Start",
+            command=partial(self.toggle_strategy, row_id),
+        )
+        menu.add_command(
+            label="Set Params", command=partial(self.show_parameters_dialog, row_id)
+        )
+        menu.add_command(label="Delete", command=partial(self.delete_strategy, row_id))
+        try:
+            menu.tk_popup(x_root, y_root)
+        finally:
+            menu.grab_release()
+
+    def _row_values(self, row_id):
+        """Build the table values for a strategy row."""
+        row = self.active_strategies[row_id]
+        return (
+            row.strategy,
+            row.symbol,
+            row.timeframe,
+            row.balance,
+            row.tp,
+            row.sl,
+            "Set" if self.strategy_parameters.get(row_id) else "Not Set",
+            row.status,
+            "Stop / Delete" if row.is_active else "Start / Delete",
+        )
 
-            # Create delete button
-            delete_btn = ttk.Button(
-                button_frame,
-                text="Delete",
-                command=lambda: self.delete_strategy(row_id),
-            )
-            delete_btn.pack(side=tk.LEFT, padx=2, fill=tk.Y)
-
-            # Store buttons in the strategy data
-            self.active_strategies[row_id]["toggle_btn"] = toggle_btn
-            self.active_strategies[row_id]["delete_btn"] = delete_btn
-
-    def _update_table_row_values(self, item_id):
-        """Update the values in a table row from the variables."""
-        for row_id, strategy_data in self.active_strategies.items():
-            # Find if this item belongs to this row
-            for check_id in self.table.get_children():
-                if check_id == item_id:
-                    # Update values from variables
-                    self.table.item(
-                        item_id,
-                        values=(
-                            strategy_data["strategy_var"].get(),
-                            strategy_data["symbol_var"].get(),
-                            strategy_data["timeframe_var"].get(),
-                            strategy_data["balance_var"].get(),
-                            strategy_data["tp_var"].get(),
-                            strategy_data["sl_var"].get(),
-                            "Set"
-                            if self.strategy_parameters.get(row_id)
-                            else "Not Set",
-                            strategy_data["status_var"].get(),
-                            "",  # Actions column has widgets
-                        ),
-                    )
-                    break
+    def _mark_dirty(self, row_id, *columns):
+        """Schedule a refresh of a row's cells, coalesced into one idle pass."""
+        self._dirty_rows.setdefault(row_id, set()).update(columns)
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.after_idle(self._flush_refresh)
+
+    def _flush_refresh(self):
+        """Write the changed cells, and status colors, of every changed row."""
+        dirty_rows = self._dirty_rows
+        self._dirty_rows = {}
+        self._refresh_pending = False
+
+        for row_id, columns in dirty_rows.items():
+            row = self.active_strategies.get(row_id)
+            if row is None:  # Deleted since it was marked
+                continue
+
+            # Only the changed cells are sent, not the whole values tuple
+            values = self._row_values(row_id)
+            for column in columns:
+                self.table.set(row.item_id, column, values[int(column[1:]) - 1])
+            if _STATUS_COLUMN in columns:
+                self.table.item(
+                    row.item_id, tags=("active" if row.is_active else "inactive",)
+                )
 
     def show_parameters_dialog(self, row_id):
         """Show the parameters dialog for a strategy."""
-        strategy_type = self.active_strategies[row_id]["strategy_var"].get()
+        strategy_type = self.active_strategies[row_id].strategy
 
         # Get existing parameters if any
         existing_params = self.strategy_parameters.get(row_id, {})
 
-        # Show dialog
-        dialog = StrategyParametersDialog(self, strategy_type, existing_params)
+        # Show dialog, building it the first time this strategy type is used
+        dialog = self._param_dialogs.get(strategy_type)
+        if dialog is None:
+            dialog = StrategyParametersDialog(self, strategy_type)
+            self._param_dialogs[strategy_type] = dialog
+        result = dialog.open(existing_params)
 
         # Process result
-        if dialog.result:
+        if result:
             # Save parameters
-            self.strategy_parameters[row_id] = dialog.result
+            self.strategy_parameters[row_id] = result
 
             # Update the table to show params are set
-            for item_id in self.table.get_children():
-                values = self.table.item(item_id)["values"]
-                if values and values[0] == strategy_type:
-                    values_list = list(values)
-                    values_list[6] = "Set"
-                    self.table.item(item_id, values=tuple(values_list))
-                    break
+            self._mark_dirty(row_id, _PARAMETERS_COLUMN)
 
             if self.log_callback:
                 self.log_callback(
@@ -413,7 +519,7 @@ class StrategyPanel(ttk.Frame):
             return
 
         strategy_data = self.active_strategies[row_id]
-        is_active = strategy_data["is_active"]
+        is_active = strategy_data.is_active
 
         # Validate inputs before activating
         if not is_active:
@@ -423,28 +529,26 @@ class StrategyPanel(ttk.Frame):
         # Toggle status
         if is_active:
             # Deactivate
-            strategy_data["status_var"].set("INACTIVE")
-            strategy_data["toggle_btn"].configure(text="Start")
-            strategy_data["is_active"] = False
+            strategy_data.status = "INACTIVE"
+            strategy_data.is_active = False
 
             # Log deactivation
-            strategy_type = strategy_data["strategy_var"].get()
-            symbol = strategy_data["symbol_var"].get()
-            timeframe = strategy_data["timeframe_var"].get()
+            strategy_type = strategy_data.strategy
+            symbol = strategy_data.symbol
+            timeframe = strategy_data.timeframe
             if self.log_callback:
                 self.log_callback(
                     f"Stopped {strategy_type} strategy on {symbol}/{timeframe}", "INFO"
                 )
         else:
             # Activate
-            strategy_data["status_var"].set("ACTIVE")
-            strategy_data["toggle_btn"].configure(text="Stop")
-            strategy_data["is_active"] = True
+            strategy_data.status = "ACTIVE"
+            strategy_data.is_active = True
 
             # Log activation
-            strategy_type = strategy_data["strategy_var"].get()
-            symbol = strategy_data["symbol_var"].get()
-            timeframe = strategy_data["timeframe_var"].get()
+            strategy_type = strategy_data.strategy
+            symbol = strategy_data.symbol
+            timeframe = strategy_data.timeframe
             if self.log_callback:
                 self.log_callback(
                     f"Started {strategy_type} strategy on {symbol}/{timeframe}",
@@ -452,7 +556,7 @@ class StrategyPanel(ttk.Frame):
                 )
 
         # Update table
-        self._update_strategies_table()
+        self._mark_dirty(row_id, _STATUS_COLUMN, _ACTIONS_COLUMN)
 
     def delete_strategy(self, row_id):
         """Delete a strategy row."""
@@ -461,7 +565,7 @@ class StrategyPanel(ttk.Frame):
 
         # Check if strategy is active
         strategy_data = self.active_strategies[row_id]
-        if strategy_data["is_active"]:
+        if strategy_data.is_active:
             self.toggle_strategy(row_id)  # Deactivate first
 
         # Remove from parameters dictionary
@@ -469,19 +573,10 @@ class StrategyPanel(ttk.Frame):
             del self.strategy_parameters[row_id]
 
         # Remove row from table
-        for item_id in self.table.get_children():
-            values = self.table.item(item_id)["values"]
-            strat_type = strategy_data["strategy_var"].get()
-            symbol = strategy_data["symbol_var"].get()
-
-            if (
-                values
-                and values[0] == strat_type
-                and values[1] == symbol
-                and values[7] == strategy_data["status_var"].get()
-            ):
-                self.table.delete(item_id)
-                break
+        if self._editing and self._editing[0] == row_id:
+            self._cancel_edit()
+        self.table.delete(strategy_data.item_id)
+        del self._row_by_item[strategy_data.item_id]
 
         # Remove from active strategies
         del self.active_strategies[row_id]
@@ -492,39 +587,13 @@ class StrategyPanel(ttk.Frame):
                 f"Deleted strategy configuration (row {row_id + 1})", "INFO"
             )
 
-    def _update_strategies_table(self):
-        """Update the table with current strategy data."""
-        for row_id, strategy_data in self.active_strategies.items():
-            for item_id in self.table.get_children():
-                values = self.table.item(item_id)["values"]
-                strat_type = strategy_data["strategy_var"].get()
-                symbol = strategy_data["symbol_var"].get()
-
-                if values and values[0] == strat_type and values[1] == symbol:
-                    values_list = list(values)
-                    values_list[7] = strategy_data["status_var"].get()
-                    self.table.item(item_id, values=tuple(values_list))
-
-                    # Apply color based on status
-                    if strategy_data["status_var"].get() == "ACTIVE":
-                        self.table.tag_configure(
-                            f"active_{row_id}", foreground=Colors.SUCCESS
-                        )
-                        self.table.item(item_id, tags=(f"active_{row_id}",))
-                    else:
-                        self.table.tag_configure(
-                            f"inactive_{row_id}", foreground=Colors.FOREGROUND
-                        )
-                        self.table.item(item_id, tags=(f"inactive_{row_id}",))
-                    break
-
     def _validate_strategy_inputs(self, row_id):
         """Validate strategy inputs before activation."""
         strategy_data = self.active_strategies[row_id]
 
         try:
             # Check balance percentage
-            balance_pct = float(strategy_data["balance_var"].get())
+            balance_pct = float(strategy_data.balance)
             if balance_pct <= 0 or balance_pct > 100:
                 if self.log_callback:
                     self.log_callback(
@@ -533,7 +602,7 @@ class StrategyPanel(ttk.Frame):
                 return False
 
             # Check take profit
-            tp_pct = float(strategy_data["tp_var"].get())
+            tp_pct = float(strategy_data.tp)
             if tp_pct <= 0:
                 if self.log_callback:
                     self.log_callback(
@@ -542,7 +611,7 @@ class StrategyPanel(ttk.Frame):
                 return False
 
             # Check stop loss
-            sl_pct = float(strategy_data["sl_var"].get())
+            sl_pct = float(strategy_data.sl)
             if sl_pct <= 0:
                 if self.log_callback:
                     self.log_callback(
@@ -551,7 +620,7 @@ class StrategyPanel(ttk.Frame):
                 return False
 
             # Check strategy parameters
-            strategy_type = strategy_data["strategy_var"].get()
+            strategy_type = strategy_data.strategy
             if (
                 row_id not in self.strategy_parameters
                 or not self.strategy_parameters[row_id]
@@ -564,17 +633,11 @@ class StrategyPanel(ttk.Frame):
 
             # Validate specific parameters based on strategy type
             params = self.strategy_parameters[row_id]
-            if strategy_type == "Technical":
-                required_params = ["ema_fast", "ema_slow", "ema_signal"]
-                if not all(param in params for param in required_params):
-                    if self.log_callback:
-                        self.log_callback("Missing required MACD parameters", "ERROR")
-                    return False
-            elif strategy_type == "Breakout":
-                if "min_volume" not in params:
-                    if self.log_callback:
-                        self.log_callback("Missing minimum volume parameter", "ERROR")
-                    return False
+            required = _REQUIRED_PARAMS.get(strategy_type)
+            if required and not required[0].issubset(params):
+                if self.log_callback:
+                    self.log_callback(required[1], "ERROR")
+                return False
 
             return True
         except ValueError:
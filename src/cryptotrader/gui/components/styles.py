@@ -56,6 +56,10 @@ def apply_theme(root: tk.Tk) -> Dict[str, tkfont.Font]:
     Returns:
         Dictionary of fonts created for the application
     """
+    # Read the theme colors once rather than per style below
+    bg, bg_light = Colors.BACKGROUND, Colors.BACKGROUND_LIGHT
+    fg, accent = Colors.FOREGROUND, Colors.ACCENT
+    
     # Configure the ttk theme
     style = ttk.Style(root)
     
@@ -63,46 +67,46 @@ def apply_theme(root: tk.Tk) -> Dict[str, tkfont.Font]:
     style.theme_use('clam')
     
     # Configure main window background
-    root.configure(background=Colors.BACKGROUND)
+    root.configure(background=bg)
     
     # Configure ttk styles
-    style.configure('TFrame', background=Colors.BACKGROUND)
-    style.configure('TLabel', background=Colors.BACKGROUND, foreground=Colors.FOREGROUND)
+    style.configure('TFrame', background=bg)
+    style.configure('TLabel', background=bg, foreground=fg)
     style.configure('TButton', 
-                   background=Colors.BACKGROUND_LIGHT, 
-                   foreground=Colors.FOREGROUND,
+                   background=bg_light, 
+                   foreground=fg,
                    borderwidth=1)
     style.map('TButton',
-             background=[('active', Colors.ACCENT), ('pressed', Colors.ACCENT)],
+             background=[('active', accent), ('pressed', accent)],
              foreground=[('active', 'white'), ('pressed', 'white')])
     
-    style.configure('TNotebook', background=Colors.BACKGROUND)
+    style.configure('TNotebook', background=bg)
     style.configure('TNotebook.Tab', 
-                   background=Colors.BACKGROUND_LIGHT, 
-                   foreground=Colors.FOREGROUND,
+                   background=bg_light, 
+                   foreground=fg,
                    padding=[10, 2])
     style.map('TNotebook.Tab',
-             background=[('selected', Colors.BACKGROUND), ('active', Colors.ACCENT)],
-             foreground=[('selected', Colors.FOREGROUND), ('active', 'white')])
+             background=[('selected', bg), ('active', accent)],
+             foreground=[('selected', fg), ('active', 'white')])
     
     style.configure('TCombobox', 
-                   background=Colors.BACKGROUND_LIGHT,
-                   fieldbackground=Colors.BACKGROUND_LIGHT,
-                   foreground=Colors.FOREGROUND,
-                   arrowcolor=Colors.FOREGROUND)
+                   background=bg_light,
+                   fieldbackground=bg_light,
+                   foreground=fg,
+                   arrowcolor=fg)
     
     style.configure('Vertical.TScrollbar', 
-                   background=Colors.BACKGROUND_LIGHT,
-                   arrowcolor=Colors.FOREGROUND,
-                   troughcolor=Colors.BACKGROUND)
+                   background=bg_light,
+                   arrowcolor=fg,
+                   troughcolor=bg)
     
     style.configure('Horizontal.TScrollbar', 
-                   background=Colors.BACKGROUND_LIGHT,
-                   arrowcolor=Colors.FOREGROUND,
-                   troughcolor=Colors.BACKGROUND)
+                   background=bg_light,
+                   arrowcolor=fg,
+                   troughcolor=bg)
     
     style.configure('TPanedwindow', 
-                   background=Colors.BACKGROUND,
+                   background=bg,
                    sashwidth=4,
                    sashrelief=tk.RAISED)
     
@@ -115,6 +119,28 @@ def apply_theme(root: tk.Tk) -> Dict[str, tkfont.Font]:
     # Return fonts for use in the application
     return fonts
 
+# Tcl array recording the (theme, style name) pairs already configured. It
+# lives in each interpreter, so a new Tk root starts with an empty record
+# and nothing outlives the root it belongs to. ttk styles are global to an
+# interpreter's theme, so repeating them only re-issues Tcl calls
+_CONFIGURED_STYLES_VAR = "::cryptotrader_configured_styles"
+
+def _style_needed(style: ttk.Style, name: str) -> bool:
+    """Return True the first time a style is seen for the current theme.
+    
+    Args:
+        style: Style object of the interpreter being configured
+        name: Name of the style about to be configured
+    
+    Returns:
+        Whether the style still has to be configured
+    """
+    flag = f"{_CONFIGURED_STYLES_VAR}({style.theme_use()},{name})"
+    if style.tk.getboolean(style.tk.call("info", "exists", flag)):
+        return False
+    style.tk.call("set", flag, 1)
+    return True
+
 def create_table(parent: tk.Widget, columns: List[str], height: int = 10, 
                  column_widths: Optional[List[int]] = None, 
                  padding: int = 2) -> Tuple[ttk.Frame, ttk.Treeview]:
@@ -135,17 +161,18 @@ def create_table(parent: tk.Widget, columns: List[str], height: int = 10,
     
     # Configure treeview style
     style = ttk.Style(parent)
-    style.configure("Treeview", 
-                   background=Colors.BACKGROUND,
-                   foreground=Colors.FOREGROUND,
-                   fieldbackground=Colors.BACKGROUND,
-                   rowheight=25)
-    style.configure("Treeview.Heading", 
-                   background=Colors.BACKGROUND_LIGHT,
-                   foreground=Colors.FOREGROUND,
-                   relief="flat")
-    style.map("Treeview.Heading",
-             background=[('active', Colors.ACCENT)])
+    if _style_needed(style, "Treeview"):
+        style.configure("Treeview", 
+                       background=Colors.BACKGROUND,
+                       foreground=Colors.FOREGROUND,
+                       fieldbackground=Colors.BACKGROUND,
+                       rowheight=25)
+        style.configure("Treeview.Heading", 
+                       background=Colors.BACKGROUND_LIGHT,
+                       foreground=Colors.FOREGROUND,
+                       relief="flat")
+        style.map("Treeview.Heading",
+                 background=[('active', Colors.ACCENT)])
     
     # Create column identifiers
     column_ids = [f"#{i}" for i in range(len(columns))]
@@ -153,14 +180,12 @@ def create_table(parent: tk.Widget, columns: List[str], height: int = 10,
     # Create the treeview
     treeview = ttk.Treeview(frame, columns=column_ids, show='headings', height=height)
     
-    # Set column headings
-    for i, col in enumerate(columns):
-        treeview.heading(f"#{i}", text=col)
-        if column_widths and i < len(column_widths):
-            treeview.column(f"#{i}", width=column_widths[i], stretch=True, anchor=tk.CENTER)
-        else:
-            # Default width if not specified
-            treeview.column(f"#{i}", width=100, stretch=True, anchor=tk.CENTER)
+    # Set column headings; columns without a given width default to 100
+    widths = dict(zip(column_ids, column_widths or ()))
+    for column_id, col in zip(column_ids, columns):
+        treeview.heading(column_id, text=col)
+        treeview.column(column_id, width=widths.get(column_id, 100), stretch=True,
+                        anchor=tk.CENTER)
     
     # Create scrollbar
     scrollbar = ttk.Scrollbar(frame, orient="vertical", command=treeview.yview)
@@ -190,15 +215,17 @@ def create_button(parent: tk.Widget, text: str, command: Optional[callable] = No
     
     if style == 'success':
         custom_style = ttk.Style(parent)
-        custom_style.configure('Success.TButton', background=Colors.SUCCESS)
-        custom_style.map('Success.TButton',
-                        background=[('active', Colors.SUCCESS), ('pressed', Colors.SUCCESS)])
+        if _style_needed(custom_style, 'Success.TButton'):
+            custom_style.configure('Success.TButton', background=Colors.SUCCESS)
+            custom_style.map('Success.TButton',
+                            background=[('active', Colors.SUCCESS), ('pressed', Colors.SUCCESS)])
         button.configure(style='Success.TButton')
     elif style == 'danger':
         custom_style = ttk.Style(parent)
-        custom_style.configure('Danger.TButton', background=Colors.ERROR)
-        custom_style.map('Danger.TButton',
-                        background=[('active', Colors.ERROR), ('pressed', Colors.ERROR)])
+        if _style_needed(custom_style, 'Danger.TButton'):
+            custom_style.configure('Danger.TButton', background=Colors.ERROR)
+            custom_style.map('Danger.TButton',
+                            background=[('active', Colors.ERROR), ('pressed', Colors.ERROR)])
         button.configure(style='Danger.TButton')
     
     return button
@@ -7,10 +7,13 @@ Displays executed trades information in a styled, dark-themed table.
 
 import tkinter as tk
 from tkinter import ttk
-from datetime import datetime
 import typing
 
 from cryptotrader.config import get_logger
+from cryptotrader.gui.components.logic.trade_history_logic import (
+    format_trade_amount,
+    format_trade_time,
+)
 from cryptotrader.gui.app_styles import (
     apply_theme,
     Colors,
@@ -27,6 +30,8 @@ class TradesWatch(tk.Frame):
 
     def __init__(self, parent: tk.Widget):
         super().__init__(parent, bg=Colors.BACKGROUND)
+        # Row ids already in the table, so updates need no Tcl lookup
+        self._trade_ids: typing.Set[str] = set()
         # Apply global theme and retrieve fonts
         fonts = apply_theme(self.winfo_toplevel())
 
@@ -77,8 +82,8 @@ class TradesWatch(tk.Frame):
 
     def clear_trades(self):
         """Remove all trades from the table."""
-        for iid in self.trades_tree.get_children():
-            self.trades_tree.delete(iid)
+        self.trades_tree.delete(*self._trade_ids)
+        self._trade_ids.clear()
         logger.info("Cleared all trades")
 
     def add_trade(self, data: typing.Dict):
@@ -86,7 +91,7 @@ class TradesWatch(tk.Frame):
         # Format timestamp
         ts = data.get("time")
         if isinstance(ts, (int, float)):
-            time_str = datetime.fromtimestamp(ts / 1000).strftime("%Y-%m-%d %H:%M:%S")
+            time_str = format_trade_time(ts)
         else:
             time_str = str(ts)
 
@@ -94,11 +99,8 @@ class TradesWatch(tk.Frame):
         strategy = data.get("strategy", "Manual")
         side = data.get("side", "BUY").upper()
 
-        price = data.get("price", 0)
-        price_str = f"{price:.8f}" if isinstance(price, (int, float)) else str(price)
-
-        qty = data.get("quantity", 0)
-        qty_str = f"{qty:.8f}" if isinstance(qty, (int, float)) else str(qty)
+        price_str = format_trade_amount(data.get("price", 0))
+        qty_str = format_trade_amount(data.get("quantity", 0))
 
         status = data.get("status", "")
 
@@ -106,10 +108,11 @@ class TradesWatch(tk.Frame):
         item_id = f"{time_str}_{symbol}_{side}"
         values = (time_str, symbol, strategy, side, price_str, qty_str, status)
 
-        if self.trades_tree.exists(item_id):
+        if item_id in self._trade_ids:
             self.trades_tree.item(item_id, values=values)
             logger.info(f"Updated trade {item_id}")
         else:
+            self._trade_ids.add(item_id)
             self.trades_tree.insert(
                 "",
                 "end",
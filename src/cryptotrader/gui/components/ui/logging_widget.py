@@ -54,9 +54,9 @@ class LoggingWidget(ttk.Frame):
 
     def add_log(self, message: str, level: str = "INFO"):
         log_entry = self.logic.add_log(message, level)
-        formatted = f"[{log_entry['timestamp']}] {log_entry['level']}: {log_entry['message']}\n"
+        formatted = f"[{log_entry.timestamp}] {log_entry.level}: {log_entry.message}\n"
 
-        self.log_view.insert(tk.END, formatted, log_entry["level"])
+        self.log_view.insert(tk.END, formatted, log_entry.level)
         self.log_view.see(tk.END)
 
     def clear_logs(self):
@@ -7,24 +7,45 @@ Displays executed trades in a grid layout with add, clear, and mock methods.
 """
 import tkinter as tk
 from tkinter import ttk
-from datetime import datetime
 import typing
 import time
 import random
 
 from cryptotrader.config import get_logger
 from cryptotrader.gui.components.styles import Colors
-from cryptotrader.gui.components.logic.trade_history_logic import TradeHistoryLogic
+from cryptotrader.gui.components.logic.trade_history_logic import (
+    TradeHistoryLogic,
+    format_trade_amount,
+    format_trade_time,
+)
 
 logger = get_logger(__name__)
 
+# Rows assumed per screen until the table has been laid out
+DEFAULT_VISIBLE_ROWS = 15
+
 class TradeHistoryWidget(ttk.Frame):
-    """UI component for displaying historical trades and PNL."""
+    """UI component for displaying historical trades and PNL.
+
+    The table is virtualized: every trade is kept in Python, and only a pool
+    of Treeview rows the size of the viewport exists. Scrolling re-skins the
+    pooled rows with the trades now in view, and the selection follows its
+    trade rather than staying on a pooled row.
+    """
 
     def __init__(self, parent: tk.Widget):
         super().__init__(parent)
         self.logic = TradeHistoryLogic()
         self.trades: typing.List[dict] = []
+        # Formatted (values, tag) for each trade in self.trades
+        self._rows: typing.List[typing.Tuple[tuple, str]] = []
+        # Treeview items reused to show the trades in view
+        self._pool: typing.List[str] = []
+        # Index of the trade shown in the top row, and rows that fit on screen
+        self._first = 0
+        self._visible_rows = DEFAULT_VISIBLE_ROWS
+        # Index in self.trades of the selected trade, if any
+        self._selected: typing.Optional[int] = None
 
         self._init_ui()
         # Optionally populate with mock trades:
@@ -41,13 +62,24 @@ class TradeHistoryWidget(ttk.Frame):
 
         # Treeview for trades
         columns = ("time", "symbol", "strategy", "side", "price", "quantity", "status")
-        self.trades_tree = ttk.Treeview(self, columns=columns, show="headings", height=15)
+        self.trades_tree = ttk.Treeview(
+            self,
+            columns=columns,
+            show="headings",
+            height=DEFAULT_VISIBLE_ROWS,
+            selectmode="browse",
+        )
         self.trades_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.trades_tree.yview)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.trades_tree.configure(yscrollcommand=scrollbar.set)
+        # Scrollbar moves the viewport over self.trades, not the Treeview
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scroll)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.trades_tree.bind("<Configure>", self._on_resize)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.trades_tree.bind(sequence, self._on_mousewheel)
+        self.trades_tree.bind("<<TreeviewSelect>>", self._on_select)
+        for sequence in ("<Up>", "<Down>", "<Prior>", "<Next>"):
+            self.trades_tree.bind(sequence, self._on_key)
 
         # Configure columns and headings
         widths = {
@@ -66,16 +98,36 @@ class TradeHistoryWidget(ttk.Frame):
         """
         Add a single trade record to the treeview.
         """
+        self.trades.append(data)
+        self._rows.append(self._format_row(data))
+
+        # Only redraw when the new trade lands inside the viewport
+        if len(self._rows) <= self._first + self._visible_rows:
+            self._render_viewport()
+        else:
+            self._update_scrollbar()
+
+        logger.info(f"Added trade: {data.get('symbol')} {data.get('side')}")
+
+    def add_trades(self, trades: typing.List[typing.Dict]):
+        """
+        Add many trade records with a single table redraw.
+        """
+        self.trades.extend(trades)
+        self._rows.extend(map(self._format_row, trades))
+        self._render_viewport()
+        logger.info(f"Added {len(trades)} trades")
+
+    def _format_row(self, data: typing.Dict) -> typing.Tuple[tuple, str]:
+        """Build the table values and color tag for a trade."""
         # Format timestamp
         ts = data.get("time", "")
         if isinstance(ts, (int, float)):
-            ts = datetime.fromtimestamp(ts / 1000).strftime("%Y-%m-%d %H:%M:%S")
+            ts = format_trade_time(ts)
 
         # Format price & quantity
-        price = data.get("price", 0)
-        price_str = f"{float(price):.8f}" if isinstance(price, (int, float)) else str(price)
-        qty = data.get("quantity", 0)
-        qty_str = f"{float(qty):.8f}" if isinstance(qty, (int, float)) else str(qty)
+        price_str = format_trade_amount(data.get("price", 0))
+        qty_str = format_trade_amount(data.get("quantity", 0))
 
         values = (
             ts,
@@ -87,16 +139,117 @@ class TradeHistoryWidget(ttk.Frame):
             data.get("status", "FILLED"),
         )
         tag = "buy" if data.get("side", "BUY") == "BUY" else "sell"
-        self.trades_tree.insert("", "end", values=values, tags=(tag,))
-
-        logger.info(f"Added trade: {data.get('symbol')} {data.get('side')}")
+        return values, tag
 
     def clear_trades(self):
         """Clear all entries from the treeview."""
-        for item in self.trades_tree.get_children():
-            self.trades_tree.delete(item)
+        self.trades.clear()
+        self._rows.clear()
+        self._first = 0
+        self._selected = None
+        self._render_viewport()
         logger.info("Cleared all trades")
 
+    def _render_viewport(self):
+        """Show the trades in view in the pooled Treeview rows."""
+        self._first = max(0, min(self._first, len(self._rows) - self._visible_rows))
+        window = self._rows[self._first:self._first + self._visible_rows]
+
+        # Size the pool to the rows in view
+        if len(self._pool) > len(window):
+            self.trades_tree.delete(*self._pool[len(window):])
+            del self._pool[len(window):]
+        while len(self._pool) < len(window):
+            self._pool.append(self.trades_tree.insert("", "end"))
+
+        for iid, (values, tag) in zip(self._pool, window):
+            self.trades_tree.item(iid, values=values, tags=(tag,))
+        self._restore_selection()
+        self._update_scrollbar()
+
+    def _restore_selection(self):
+        """Highlight the pooled row now showing the selected trade."""
+        position = -1 if self._selected is None else self._selected - self._first
+        if 0 <= position < len(self._pool):
+            iid = self._pool[position]
+            if self.trades_tree.selection() != (iid,):
+                self.trades_tree.selection_set(iid)
+            self.trades_tree.focus(iid)
+        elif self.trades_tree.selection():
+            # The selected trade is out of view; its old row shows another
+            self.trades_tree.selection_set(())
+
+    def _update_scrollbar(self):
+        """Size the scrollbar slider to the viewport's share of all trades."""
+        total = len(self._rows)
+        if total <= self._visible_rows:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(
+                self._first / total, (self._first + self._visible_rows) / total
+            )
+
+    def _scroll_by(self, rows: int):
+        """Move the viewport by a number of rows."""
+        self._first += rows
+        self._render_viewport()
+
+    def _on_scroll(self, action: str, amount: str, unit: str = "units"):
+        """Handle the scrollbar's moveto/scroll commands."""
+        if action == "moveto":
+            self._first = int(float(amount) * len(self._rows))
+            self._render_viewport()
+        elif action == "scroll":
+            step = self._visible_rows if unit == "pages" else 1
+            self._scroll_by(int(amount) * step)
+
+    def _on_select(self, event):
+        """Remember which trade the selected pooled row is showing."""
+        selection = self.trades_tree.selection()
+        # An empty selection only means the trade scrolled out of view
+        if selection and selection[0] in self._pool:
+            self._selected = self._first + self._pool.index(selection[0])
+
+    def _on_key(self, event):
+        """Scroll past the pool when the cursor moves beyond its rows."""
+        page = event.keysym in ("Prior", "Next")
+        step = self._visible_rows if page else 1
+        if event.keysym in ("Up", "Prior"):
+            step = -step
+
+        if self._selected is None:
+            if not page:
+                return None
+            self._scroll_by(step)
+            return "break"
+
+        target = max(0, min(self._selected + step, len(self._rows) - 1))
+        # Moves within the pool are left to the Treeview's own bindings
+        if not page and self._first <= target < self._first + len(self._pool):
+            return None
+
+        self._selected = target
+        if target < self._first:
+            self._first = target
+        elif target >= self._first + self._visible_rows:
+            self._first = target - self._visible_rows + 1
+        self._render_viewport()
+        return "break"
+
+    def _on_mousewheel(self, event):
+        """Scroll the viewport with the mouse wheel (Button-4/5 on X11)."""
+        self._scroll_by(-3 if event.num == 4 or event.delta > 0 else 3)
+        return "break"
+
+    def _on_resize(self, event):
+        """Resize the row pool to the rows that fit in the table."""
+        row_height = int(ttk.Style(self).lookup("Treeview", "rowheight") or 20)
+        # One row's worth of height is taken by the headings
+        visible_rows = max(1, event.height // row_height - 1)
+        if visible_rows != self._visible_rows:
+            self._visible_rows = visible_rows
+            self._render_viewport()
+
     def add_mock_trades(self, count: int = 10):
         """
         Populate the treeview with mock trades for testing.
@@ -107,9 +260,10 @@ class TradeHistoryWidget(ttk.Frame):
         sides = ["BUY", "SELL"]
         statuses = ["FILLED", "PARTIALLY_FILLED", "CANCELED"]
 
-        for _ in range(count):
-            trade = {
-                "time": int(time.time() * 1000) - random.randint(0, 1_000_000),
+        now_ms = int(time.time() * 1000)
+        trades = [
+            {
+                "time": now_ms - random.randint(0, 1_000_000),
                 "symbol": random.choice(symbols),
                 "strategy": random.choice(strategies),
                 "side": random.choice(sides),
@@ -117,4 +271,6 @@ class TradeHistoryWidget(ttk.Frame):
                 "quantity": random.uniform(0.01, 2),
                 "status": random.choice(statuses),
             }
-            self.add_trade(trade)
+            for _ in range(count)
+        ]
+        self.add_trades(trades)
@@ -8,15 +8,20 @@ Symbol entry, exchange selector, and Add button are all here.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import List, Dict
+from concurrent.futures import Future
+from typing import List, Dict, Optional
 
 from cryptotrader.config import get_logger
 from cryptotrader.gui.components.logic.watchlist_logic import WatchlistLogic
-from cryptotrader.services.unified_clients.binanceRestUnifiedClient import BinanceRestUnifiedClient
+from cryptotrader.services.unified_clients.binanceRestUnifiedClient import get_binance_client
 from cryptotrader.gui.app_styles import Colors, StyleNames, create_button
 
 logger = get_logger(__name__)
 
+# Milliseconds between price refreshes, and between checks for a finished fetch
+REFRESH_INTERVAL_MS = 5000
+RESULT_POLL_MS = 100
+
 
 class WatchlistWidget(ttk.Frame):
     """
@@ -32,7 +37,7 @@ class WatchlistWidget(ttk.Frame):
         self.configure(style='TFrame', padding=(10, 10))
 
         self.logger = logger
-        self.unified_client = BinanceRestUnifiedClient()
+        self.unified_client = get_binance_client()
         self.logic = WatchlistLogic(self.unified_client)
 
         # track symbols in insertion order
@@ -40,11 +45,13 @@ class WatchlistWidget(ttk.Frame):
         # map column/header → list of widgets or StringVars (for “Bid” and “Ask”)
         self.body_widgets: Dict[str, List] = {}
         self._headers = ["Symbol", "Bid", "Ask", "Remove"]
-        # store after-job IDs so we can cancel when a symbol is removed
-        self._refresh_jobs: Dict[str, str] = {}
+        # one refresh cycle fetches every watched symbol concurrently
+        self._refresh_job: Optional[str] = None
+        self._pending: Optional[Future] = None
 
         # Initialize UI
         self._init_ui()
+        self._refresh_prices()
 
     def set_available_symbols(self, symbols: List[str]) -> None:
         """
@@ -125,7 +132,10 @@ class WatchlistWidget(ttk.Frame):
         self.watched_symbols.append(symbol)
         self._add_row(symbol)
         self.symbol_var.set("")
-        self._refresh_symbol(symbol)
+        # Refresh now rather than waiting for the next cycle
+        if self._refresh_job:
+            self.after_cancel(self._refresh_job)
+        self._refresh_prices()
 
     def _add_row(self, symbol: str) -> None:
         row = 2 + (len(self.watched_symbols) - 1)
@@ -158,12 +168,26 @@ class WatchlistWidget(ttk.Frame):
         btn_rm.grid(row=row, column=3, padx=5, pady=2)
         self.body_widgets.setdefault("Remove", []).append(btn_rm)
 
-    def _refresh_symbol(self, symbol: str) -> None:
-        def callback(sym: str, data: dict) -> None:
-            self._update_symbol_data(sym, data)
-        self.logic.fetch_symbol_data(symbol, callback)
-        job = self.after(5000, lambda: self._refresh_symbol(symbol))
-        self._refresh_jobs[symbol] = job
+    def _refresh_prices(self) -> None:
+        # Start a batch fetch unless the previous one is still in flight
+        if self.watched_symbols and self._pending is None:
+            self._pending = self.logic.fetch_symbols_data(list(self.watched_symbols))
+            self.after(RESULT_POLL_MS, self._collect_prices)
+        self._refresh_job = self.after(REFRESH_INTERVAL_MS, self._refresh_prices)
+
+    def _collect_prices(self) -> None:
+        # Results arrive on the fetch thread; apply them from the Tk loop
+        if not self._pending.done():
+            self.after(RESULT_POLL_MS, self._collect_prices)
+            return
+        future, self._pending = self._pending, None
+        try:
+            tickers = future.result()
+        except Exception as e:
+            logger.error(f"Error fetching watchlist prices: {e}")
+            return
+        for symbol, data in tickers.items():
+            self._update_symbol_data(symbol, data)
 
     def _update_symbol_data(self, symbol: str, data: dict) -> None:
         try:
@@ -179,9 +203,6 @@ class WatchlistWidget(ttk.Frame):
         if symbol not in self.watched_symbols:
             return
         idx = self.watched_symbols.index(symbol)
-        job = self._refresh_jobs.pop(symbol, None)
-        if job:
-            self.after_cancel(job)
         self.watched_symbols.pop(idx)
         for key, lst in list(self.body_widgets.items()):
             item = lst.pop(idx)
@@ -162,7 +162,7 @@ class BinanceEndpoints:
     wss_url: str = "wss://stream.binance.us:9443/ws"
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceData:
     """Data structure for bid/ask prices"""
 
@@ -186,7 +186,7 @@ class OrderRequest:
     selfTradePreventionMode: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Candle:
     """Data structure for candlestick data"""
 
@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceData:
     """Data structure for bid/ask prices"""
 
@@ -17,7 +17,7 @@ class PriceData:
     ask: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Candle:
     """Data structure for candlestick data"""
 
@@ -11,10 +11,12 @@ It handles:
 
 import time
 import hmac
-import hashlib
+import asyncio
 import urllib.parse
+import weakref
+from functools import lru_cache
 import httpx
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Tuple
 
 from cryptotrader.config import get_logger, Secrets
 from cryptotrader.services.binance.models import (
@@ -25,6 +27,108 @@ from cryptotrader.services.binance.models import (
 
 logger = get_logger(__name__)
 
+try:
+    # Optional: orjson parses response bytes directly and is much faster on
+    # large payloads such as exchangeInfo
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    from json import loads as _json_loads
+
+_SUPPORTED_METHODS = frozenset({"GET", "POST", "DELETE"})
+
+# Digest Binance signatures are computed with
+_SIGNING_DIGEST = "sha256"
+
+
+def timestampMs() -> int:
+    """
+    Get the current Unix time in milliseconds, as Binance expects in signed requests.
+
+    Uses integer nanoseconds to avoid the float multiply and rounding of time.time().
+
+    Returns:
+        Milliseconds since the epoch
+    """
+    return time.time_ns() // 1_000_000
+
+# Shared HTTP client so keep-alive connections to Binance are reused across requests
+_http_client: Optional[httpx.Client] = None
+
+# Connection pool size for the Binance clients. httpx ignores a client's
+# limits= once a transport is given, so these go on the transport itself.
+# Failed connections are retried with backoff by execute(), not the transport.
+_HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+
+
+def _getHttpClient() -> httpx.Client:
+    """
+    Get the process-wide HTTP client, creating it on first use.
+
+    Returns:
+        Pooled httpx client shared by all Binance REST requests
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(transport=httpx.HTTPTransport(limits=_HTTP_LIMITS))
+        logger.debug("HTTP client created; requests are signed with HMAC-%s", _SIGNING_DIGEST)
+    return _http_client
+
+
+# Async clients are bound to the event loop they were created on, so keep one per loop
+_async_http_clients = weakref.WeakKeyDictionary()
+
+
+def _getAsyncHttpClient() -> httpx.AsyncClient:
+    """
+    Get the pooled async HTTP client for the running event loop.
+
+    Returns:
+        Pooled httpx async client shared by all requests on this loop
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_http_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(transport=httpx.AsyncHTTPTransport(limits=_HTTP_LIMITS))
+        _async_http_clients[loop] = client
+    return client
+
+
+@lru_cache(maxsize=4)
+def _hmacPrototype(secret_key: str) -> hmac.HMAC:
+    """
+    Get a keyed HMAC-SHA256 object for the given secret.
+
+    Keying SHA-256 means hashing the padded key into the inner and outer states;
+    doing that once and copying the keyed object per signature skips the work.
+    Callers must copy() before update() since the prototype is shared.
+
+    Args:
+        secret_key: API secret used as the HMAC key
+
+    Returns:
+        HMAC object keyed with the secret and no message data
+    """
+    # Naming the digest lets hmac hand the whole computation to OpenSSL's HMAC
+    return hmac.new(secret_key.encode("utf-8"), digestmod=_SIGNING_DIGEST)
+
+
+def signPayload(secret_key: str, payload: bytes) -> str:
+    """
+    Compute the HMAC-SHA256 signature Binance expects for a request payload.
+
+    Shared by the REST and WebSocket clients so both reuse the cached key state.
+
+    Args:
+        secret_key: API secret used as the HMAC key
+        payload: Exact bytes of the query string being signed
+
+    Returns:
+        Lowercase hex signature
+    """
+    mac = _hmacPrototype(secret_key).copy()
+    mac.update(payload)
+    return mac.hexdigest()
+
 
 class BinanceAPIRequest:
     """
@@ -95,25 +199,113 @@ class BinanceAPIRequest:
                 self.params[key] = value
         return self
 
-    def _signRequest(self) -> None:
+    def _signRequest(self) -> str:
         """
         Sign the request with the API secret.
 
-        Adds timestamp and signature to the parameters.
+        Adds a fresh timestamp to the parameters and encodes them once; the same
+        string is both signed and sent, so the server verifies exactly the bytes
+        that were signed.
+
+        Returns:
+            Encoded query string with the signature appended
         """
         # Add timestamp
-        self.params["timestamp"] = str(int(time.time() * 1000))
+        self.params["timestamp"] = str(timestampMs())
 
         # Create signature
         query_string = urllib.parse.urlencode(self.params)
-        signature = hmac.new(
-            self.secret_key.encode("utf-8"),
-            query_string.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
+        signature = signPayload(self.secret_key, query_string.encode("utf-8"))
+
+        return f"{query_string}&signature={signature}"
+
+    def _rateLimitDelay(self, retries: int, retry_delay: int) -> Optional[float]:
+        """
+        Check the local rate limiter before sending.
+
+        Args:
+            retries: Number of attempts made so far
+            retry_delay: Initial delay between retries (in seconds)
 
-        # Add signature to params
-        self.params["signature"] = signature
+        Returns:
+            Seconds to wait before retrying, or None if the request may proceed
+        """
+        if self.rate_limiter._checkRateLimit(self.limit_type, self.weight):
+            return None
+
+        retry_after = self.rate_limiter._getRetryAfter()
+        if retry_after > 0:
+            delay = retry_after
+        else:
+            # Use exponential backoff
+            delay = retry_delay * (2**retries)
+        logger.warning(f"Rate limit hit, retrying after {delay}s")
+        return delay
+
+    def _prepareRequest(
+        self, url: str
+    ) -> Tuple[str, Optional[Dict[str, Any]], Dict[str, str]]:
+        """
+        Build the URL, query parameters and headers for one attempt.
+
+        Args:
+            url: Full endpoint URL without a query string
+
+        Returns:
+            Tuple of (request URL, query params or None, headers)
+        """
+        # Sign the request if needed; the signed query goes into the URL
+        # untouched so httpx does not re-encode it
+        if self.needs_signature:
+            request_url = f"{url}?{self._signRequest()}"
+            params = None
+        else:
+            request_url = url
+            params = self.params
+
+        # Set up headers
+        headers = {}
+        if self.public_key and self.needs_signature:
+            headers["X-MBX-APIKEY"] = self.public_key
+
+        logger.debug(
+            "Making %s request to %s with params: %s", self.method, url, self.params
+        )
+        return request_url, params, headers
+
+    def _handleResponse(
+        self, response: httpx.Response
+    ) -> Tuple[Optional[Any], Optional[float]]:
+        """
+        Interpret a response and update the rate limiter.
+
+        Args:
+            response: HTTP response from Binance
+
+        Returns:
+            Tuple of (parsed JSON or None, seconds to wait before retrying or None)
+        """
+        # Update rate limiter with response headers
+        self.rate_limiter._updateLimits(response.headers)
+
+        # Handle response status
+        if response.status_code == 200:
+            # Successful response - increment the rate limiter usage
+            self.rate_limiter._incrementUsage(self.limit_type, self.weight)
+            return _json_loads(response.content), None
+        elif response.status_code == 429 or response.status_code == 418:
+            # Rate limit exceeded
+            retry_after = int(response.headers.get("Retry-After", 1))
+            logger.warning(
+                f"Rate limit exceeded (status {response.status_code}), retrying after {retry_after}s"
+            )
+            return None, retry_after
+        else:
+            # Other error
+            logger.error(
+                f"Error while making {self.method} request to {self.endpoint}: {response.text} (error code {response.status_code})"
+            )
+            return None, None
 
     def execute(self, max_retries: int = 3, retry_delay: int = 1) -> Optional[Any]:
         """
@@ -128,109 +320,99 @@ class BinanceAPIRequest:
         Returns:
             Parsed JSON response or None if request failed
         """
+        if self.method not in _SUPPORTED_METHODS:
+            logger.error(f"Unsupported HTTP method: {self.method}")
+            return None
+
         url = f"{self.base_url}{self.endpoint}"
         retries = 0
 
         while retries <= max_retries:
             try:
                 # Check rate limits
-                if not self.rate_limiter._checkRateLimit(self.limit_type, self.weight):
-                    retry_after = self.rate_limiter._getRetryAfter()
-                    if retry_after > 0:
-                        logger.warning(f"Rate limit hit, retrying after {retry_after}s")
-                        time.sleep(retry_after)
-                    else:
-                        # Use exponential backoff
-                        current_delay = retry_delay * (2**retries)
-                        logger.warning(
-                            f"Rate limit hit, retrying after {current_delay}s"
-                        )
-                        time.sleep(current_delay)
-                    retries += 1
-                    continue
-
-                # Sign the request if needed
-                if self.needs_signature:
-                    self._signRequest()
-
-                # Set up headers
-                headers = {}
-                if self.public_key and self.needs_signature:
-                    headers["X-MBX-APIKEY"] = self.public_key
-
-                # Execute the request
-                with httpx.Client() as client:
-                    if self.method == "GET":
-                        logger.debug(
-                            f"Making GET request to {url} with params: {self.params}"
-                        )
-                        response = client.get(
-                            url,
-                            params=self.params,
-                            headers=headers,
-                            timeout=self.timeout,
-                        )
-                    elif self.method == "POST":
-                        logger.debug(
-                            f"Making POST request to {url} with params: {self.params}"
-                        )
-                        response = client.post(
-                            url,
-                            params=self.params,
-                            headers=headers,
-                            timeout=self.timeout,
-                        )
-                    elif self.method == "DELETE":
-                        logger.debug(
-                            f"Making DELETE request to {url} with params: {self.params}"
-                        )
-                        response = client.delete(
-                            url,
-                            params=self.params,
-                            headers=headers,
-                            timeout=self.timeout,
-                        )
-                    else:
-                        logger.error(f"Unsupported HTTP method: {self.method}")
-                        return None
-
-                # Update rate limiter with response headers
-                self.rate_limiter._updateLimits(response.headers)
-
-                # Handle response status
-                if response.status_code == 200:
-                    # Successful response - increment the rate limiter usage
-                    self.rate_limiter._incrementUsage(self.limit_type, self.weight)
-                    return response.json()
-                elif response.status_code == 429 or response.status_code == 418:
-                    # Rate limit exceeded
-                    retry_after = int(response.headers.get("Retry-After", 1))
-                    logger.warning(
-                        f"Rate limit exceeded (status {response.status_code}), retrying after {retry_after}s"
-                    )
-                    time.sleep(retry_after)
-                    retries += 1
-                    continue
-                else:
-                    # Other error
-                    logger.error(
-                        f"Error while making {self.method} request to {self.endpoint}: {response.text} (error code {response.status_code})"
+                delay = self._rateLimitDelay(retries, retry_delay)
+                if delay is None:
+                    request_url, params, headers = self._prepareRequest(url)
+                    response = _getHttpClient().request(
+                        self.method,
+                        request_url,
+                        params=params,
+                        headers=headers,
+                        timeout=self.timeout,
                     )
-                    return None
+                    result, delay = self._handleResponse(response)
+                    if delay is None:
+                        return result
+
+                time.sleep(delay)
+                retries += 1
 
             except httpx.RequestError as e:
                 # Network-related error
-                if retries < max_retries:
-                    current_delay = retry_delay * (2**retries)
-                    logger.warning(
-                        f"Request error: {str(e)}, retrying after {current_delay}s"
+                if retries >= max_retries:
+                    logger.error(f"Max retries reached. Request error: {str(e)}")
+                    return None
+                current_delay = retry_delay * (2**retries)
+                logger.warning(f"Request error: {str(e)}, retrying after {current_delay}s")
+                time.sleep(current_delay)
+                retries += 1
+
+        # If we get here, we've exhausted retries
+        logger.error(f"Failed to execute request after {max_retries} retries")
+        return None
+
+    async def executeAsync(
+        self, max_retries: int = 3, retry_delay: int = 1
+    ) -> Optional[Any]:
+        """
+        Execute the API request without blocking the event loop.
+
+        Same rate limiting, retry and error handling as execute(), but sent
+        through a pooled async client so many requests can be in flight at once.
+
+        Args:
+            max_retries: Maximum number of retry attempts
+            retry_delay: Initial delay between retries (in seconds)
+
+        Returns:
+            Parsed JSON response or None if request failed
+        """
+        if self.method not in _SUPPORTED_METHODS:
+            logger.error(f"Unsupported HTTP method: {self.method}")
+            return None
+
+        url = f"{self.base_url}{self.endpoint}"
+        retries = 0
+
+        while retries <= max_retries:
+            try:
+                # Check rate limits
+                delay = self._rateLimitDelay(retries, retry_delay)
+                if delay is None:
+                    request_url, params, headers = self._prepareRequest(url)
+                    response = await _getAsyncHttpClient().request(
+                        self.method,
+                        request_url,
+                        params=params,
+                        headers=headers,
+                        timeout=self.timeout,
                     )
-                    time.sleep(current_delay)
-                    retries += 1
-                    continue
-                else:
+                    result, delay = self._handleResponse(response)
+                    if delay is None:
+                        return result
+
+                await asyncio.sleep(delay)
+                retries += 1
+
+            except httpx.RequestError as e:
+                # Network-related error
+                if retries >= max_retries:
                     logger.error(f"Max retries reached. Request error: {str(e)}")
                     return None
+                current_delay = retry_delay * (2**retries)
+                logger.warning(f"Request error: {str(e)}, retrying after {current_delay}s")
+                await asyncio.sleep(current_delay)
+                retries += 1
 
         # If we get here, we've exhausted retries
         logger.error(f"Failed to execute request after {max_retries} retries")
@@ -272,14 +454,16 @@ class RateLimiter:
             for limit in self.rate_limits
         }
 
-        # Last response headers for updating limits
-        self.last_headers = {}
+        # Last response headers for updating limits (httpx headers are case-insensitive)
+        self.last_headers = httpx.Headers()
 
-    def _updateLimits(self, headers: Dict[str, str]):
+    def _updateLimits(self, headers: httpx.Headers):
         """
         Update rate limits based on response headers.
         """
-        self.last_headers = dict(headers)
+        # Keep the response's own case-insensitive headers rather than copying them
+        # into a plain dict, which lowercased the keys and hid Retry-After
+        self.last_headers = headers
 
         # Update usage from headers if available
         # Format: X-MBX-USED-WEIGHT-1M
@@ -293,7 +477,7 @@ class RateLimiter:
                     f"{limit.rateLimitType}_{limit.interval}_{limit.intervalNum}"
                 )
                 self.usage[usage_key] = int(headers[header_key])
-                logger.debug(f"Updated {usage_key} usage to {self.usage[usage_key]}")
+                logger.debug("Updated %s usage to %s", usage_key, self.usage[usage_key])
 
     def _checkRateLimit(self, limit_type: RateLimitType, weight: int = 1) -> bool:
         """
@@ -346,7 +530,7 @@ class RateLimiter:
                 key = f"{limit.rateLimitType}_{limit.interval}_{limit.intervalNum}"
                 self.usage[key] += weight
                 logger.debug(
-                    f"Incremented {key} usage by {weight} to {self.usage[key]}"
+                    "Incremented %s usage by %s to %s", key, weight, self.usage[key]
                 )
 
     def _getRetryAfter(self) -> int:
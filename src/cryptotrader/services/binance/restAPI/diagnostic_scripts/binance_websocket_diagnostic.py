@@ -26,8 +26,9 @@ from colorama import Fore, Style, init
 init(autoreset=True)
 
 # Add the src directory to the Python path
-project_root = Path(__file__).parent.parent.parent.parent.parent  # src directory
-sys.path.insert(0, str(project_root))
+project_root = Path(__file__).resolve().parents[5]  # src directory
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 # Import our modules
 try:
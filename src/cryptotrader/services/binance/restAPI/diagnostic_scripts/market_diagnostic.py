@@ -9,7 +9,6 @@ Usage:
 """
 
 import sys
-import traceback
 from pathlib import Path
 from datetime import datetime
 from colorama import Fore, Style, init
@@ -18,8 +17,9 @@ from colorama import Fore, Style, init
 init(autoreset=True)
 
 # Add the src directory to the Python path
-project_root = Path(__file__).parent.parent.parent.parent.parent  # src directory
-sys.path.insert(0, str(project_root))
+project_root = Path(__file__).resolve().parents[5]  # src directory
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 # Import our modules
 from cryptotrader.config import get_logger
@@ -33,11 +33,11 @@ TEST_SYMBOL = "BTCUSDT"  # Use a common trading pair for testing
 
 def print_test_header(test_name):
     """Print a test header in cyan color"""
-    logger.info(f"\n{Fore.CYAN}Test: {test_name}{Style.RESET_ALL}")
+    logger.info("\n%sTest: %s%s", Fore.CYAN, test_name, Style.RESET_ALL)
 
 
 def main():
-    logger.info(f"Added {project_root} to Python path")
+    logger.info("Added %s to Python path", project_root)
 
     logger.info("Initializing Binance Market client...")
     client = MarketOperations()  # No need to pass API credentials
@@ -47,44 +47,44 @@ def main():
     try:
         btc_price = client.getBidAsk(TEST_SYMBOL)
         if btc_price:
-            logger.info(f"BTC/USDT Bid: ${btc_price.bid:.2f}")
-            logger.info(f"BTC/USDT Ask: ${btc_price.ask:.2f}")
+            logger.info("BTC/USDT Bid: $%.2f", btc_price.bid)
+            logger.info("BTC/USDT Ask: $%.2f", btc_price.ask)
         else:
             logger.error("Failed to retrieve BTC/USDT price")
     except Exception as e:
-        logger.error(f"Error retrieving BTC/USDT price: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.error("Error retrieving BTC/USDT price: %s", e)
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 2: Get historical candles
     print_test_header("Getting historical candles for BTC/USDT (1-hour interval)")
     try:
         candles = client.getHistoricalCandles(TEST_SYMBOL, "1h", limit=10)
-        logger.info(f"Retrieved {len(candles)} candles")
+        logger.info("Retrieved %s candles", len(candles))
         if candles:
             logger.info("Most recent candle:")
-            logger.info(f"  Time: {candles[-1].timestamp}")
-            logger.info(f"  Open: ${candles[-1].openPrice:.2f}")
-            logger.info(f"  High: ${candles[-1].highPrice:.2f}")
-            logger.info(f"  Low: ${candles[-1].lowPrice:.2f}")
-            logger.info(f"  Close: ${candles[-1].closePrice:.2f}")
-            logger.info(f"  Volume: {candles[-1].volume:.8f}")
+            logger.info("  Time: %s", candles[-1].timestamp)
+            logger.info("  Open: $%.2f", candles[-1].openPrice)
+            logger.info("  High: $%.2f", candles[-1].highPrice)
+            logger.info("  Low: $%.2f", candles[-1].lowPrice)
+            logger.info("  Close: $%.2f", candles[-1].closePrice)
+            logger.info("  Volume: %.8f", candles[-1].volume)
         else:
             logger.error("Failed to retrieve candles for BTC/USDT")
     except Exception as e:
-        logger.error(f"Error retrieving historical candles: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.error("Error retrieving historical candles: %s", e)
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 3: Get ticker price for BTC/USDT
     print_test_header("Getting ticker price for BTC/USDT")
     try:
         ticker = client.getTickerPrice(TEST_SYMBOL)
         if ticker:
-            logger.info(f"BTC/USDT Price: ${float(ticker.price):.2f}")
+            logger.info("BTC/USDT Price: $%.2f", float(ticker.price))
         else:
             logger.error("Failed to retrieve BTC/USDT ticker price")
     except Exception as e:
-        logger.error(f"Error retrieving ticker price: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.error("Error retrieving ticker price: %s", e)
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 4: Get average price for BTC/USDT
     print_test_header("Getting average price for BTC/USDT")
@@ -92,35 +92,43 @@ def main():
         avg_price = client.getAvgPriceRest(TEST_SYMBOL)
         if avg_price:
             logger.info(
-                f"BTC/USDT Average Price (mins={avg_price.mins}): ${avg_price.price:.2f}"
+                "BTC/USDT Average Price (mins=%s): $%.2f",
+                avg_price.mins,
+                avg_price.price,
             )
         else:
             logger.error("Failed to retrieve BTC/USDT average price")
     except Exception as e:
-        logger.error(f"Error retrieving average price: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.error("Error retrieving average price: %s", e)
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 5: Get order book
     print_test_header("Getting order book for BTC/USDT")
     try:
         order_book = client.getOrderBookRest(TEST_SYMBOL, limit=5)
         if order_book:
-            logger.info(f"Order Book Last Update ID: {order_book.lastUpdateId}")
-            logger.info(f"Top 5 Bids:")
+            logger.info("Order Book Last Update ID: %s", order_book.lastUpdateId)
+            logger.info("Top 5 Bids:")
             for i, bid in enumerate(order_book.bids[:5]):
                 logger.info(
-                    f"  {i + 1}. Price: ${bid.price:.2f}, Quantity: {bid.quantity:.8f}"
+                    "  %s. Price: $%.2f, Quantity: %.8f",
+                    i + 1,
+                    bid.price,
+                    bid.quantity,
                 )
-            logger.info(f"Top 5 Asks:")
+            logger.info("Top 5 Asks:")
             for i, ask in enumerate(order_book.asks[:5]):
                 logger.info(
-                    f"  {i + 1}. Price: ${ask.price:.2f}, Quantity: {ask.quantity:.8f}"
+                    "  %s. Price: $%.2f, Quantity: %.8f",
+                    i + 1,
+                    ask.price,
+                    ask.quantity,
                 )
         else:
             logger.error("Failed to retrieve BTC/USDT order book")
     except Exception as e:
-        logger.error(f"Error retrieving order book: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.error("Error retrieving order book: %s", e)
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 6: Get 24-hour price statistics
     print_test_header("Getting 24-hour price statistics for BTC/USDT")
@@ -128,17 +136,19 @@ def main():
         stats = client.get24hStats(TEST_SYMBOL)
         if stats:
             logger.info(
-                f"24h Price Change: ${stats.priceChange:.2f} ({stats.priceChangePercent:.2f}%)"
+                "24h Price Change: $%.2f (%.2f%%)",
+                stats.priceChange,
+                stats.priceChangePercent,
             )
-            logger.info(f"24h High: ${stats.highPrice:.2f}")
-            logger.info(f"24h Low: ${stats.lowPrice:.2f}")
-            logger.info(f"24h Volume: {stats.volume:.8f} BTC")
-            logger.info(f"24h Quote Volume: ${stats.quoteVolume:.2f}")
+            logger.info("24h High: $%.2f", stats.highPrice)
+            logger.info("24h Low: $%.2f", stats.lowPrice)
+            logger.info("24h Volume: %.8f BTC", stats.volume)
+            logger.info("24h Quote Volume: $%.2f", stats.quoteVolume)
         else:
             logger.error("Failed to retrieve BTC/USDT 24-hour statistics")
     except Exception as e:
-        logger.error(f"Error retrieving 24-hour statistics: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.error("Error retrieving 24-hour statistics: %s", e)
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 7: Get Rolling Window Statistics
     print_test_header("Getting rolling window statistics for BTC/USDT")
@@ -146,16 +156,18 @@ def main():
         rolling_stats = client.getRollingWindowStatsRest(TEST_SYMBOL, window_size="1d")
         if rolling_stats:
             logger.info(
-                f"1d Rolling Window Price Change: ${rolling_stats.priceChange:.2f} ({rolling_stats.priceChangePercent:.2f}%)"
+                "1d Rolling Window Price Change: $%.2f (%.2f%%)",
+                rolling_stats.priceChange,
+                rolling_stats.priceChangePercent,
             )
-            logger.info(f"1d Window High: ${rolling_stats.highPrice:.2f}")
-            logger.info(f"1d Window Low: ${rolling_stats.lowPrice:.2f}")
-            logger.info(f"1d Window Volume: {rolling_stats.volume:.8f} BTC")
+            logger.info("1d Window High: $%.2f", rolling_stats.highPrice)
+            logger.info("1d Window Low: $%.2f", rolling_stats.lowPrice)
+            logger.info("1d Window Volume: %.8f BTC", rolling_stats.volume)
         else:
             logger.error("Failed to retrieve BTC/USDT rolling window statistics")
     except Exception as e:
-        logger.error(f"Error retrieving rolling window statistics: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.error("Error retrieving rolling window statistics: %s", e)
+        logger.debug("Traceback:", exc_info=True)
 
     # Summary
     logger.info("\nMarket API Diagnostic Summary:")
@@ -13,7 +13,6 @@ Usage:
 
 import sys
 import time
-import traceback
 from pathlib import Path
 from datetime import datetime, timedelta
 from colorama import Fore, Style, init
@@ -22,8 +21,9 @@ from colorama import Fore, Style, init
 init(autoreset=True)
 
 # Add the src directory to the Python path
-project_root = Path(__file__).parent.parent.parent.parent.parent  # src directory
-sys.path.insert(0, str(project_root))
+project_root = Path(__file__).resolve().parents[5]  # src directory
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 # Import our modules
 from cryptotrader.config import get_logger
@@ -77,7 +77,7 @@ def main():
             logger.info(f"{Fore.YELLOW}No open orders found for {TEST_SYMBOL}")
     except Exception as e:
         logger.error(f"{Fore.RED}Error retrieving open orders: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 2: Get order rate limits
     print_test_header("Getting Order Rate Limits")
@@ -98,7 +98,7 @@ def main():
             )
     except Exception as e:
         logger.error(f"{Fore.RED}Error retrieving order rate limits: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 3: Test order creation (mock)
     print_test_header("Testing Order Creation API (No Actual Orders)")
@@ -142,7 +142,7 @@ def main():
             )
     except Exception as e:
         logger.error(f"{Fore.RED}Error during order creation test: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 4: Get recent trade history
     print_test_header("Getting Trade History")
@@ -174,7 +174,7 @@ def main():
             )
     except Exception as e:
         logger.error(f"{Fore.RED}Error retrieving trade history: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 5: Get all orders history
     print_test_header("Getting Order History")
@@ -206,7 +206,7 @@ def main():
             )
     except Exception as e:
         logger.error(f"{Fore.RED}Error retrieving order history: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 6: Get prevented matches
     print_test_header("Getting Prevented Matches")
@@ -232,7 +232,7 @@ def main():
             )
     except Exception as e:
         logger.error(f"{Fore.RED}Error retrieving prevented matches: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # New Test 7: Get Open OCO Orders
     print_test_header("Getting Open OCO Orders")
@@ -253,7 +253,7 @@ def main():
             logger.info(f"{Fore.YELLOW}No open OCO orders found")
     except Exception as e:
         logger.error(f"{Fore.RED}Error retrieving open OCO orders: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # New Test 8: Get All OCO Orders History
     print_test_header("Getting OCO Order History")
@@ -287,7 +287,7 @@ def main():
             )
     except Exception as e:
         logger.error(f"{Fore.RED}Error retrieving OCO order history: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # New Test 9: OCO Order Simulation
     print_test_header("OCO Order Simulation (No Actual Orders)")
@@ -313,7 +313,7 @@ def main():
         logger.info("- Each OCO order counts as 2 orders against rate limits")
     except Exception as e:
         logger.error(f"{Fore.RED}Error during OCO order simulation: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Original Test 7 becomes Test 10: Cancel Order Simulation
     print_test_header("Cancel Order Simulation (No Actual Cancellation)")
@@ -10,7 +10,6 @@ Usage:
 
 import sys
 import time
-import traceback
 from pathlib import Path
 from datetime import datetime
 from colorama import Fore, Style, init
@@ -19,8 +18,9 @@ from colorama import Fore, Style, init
 init(autoreset=True)
 
 # Add the src directory to the Python path
-project_root = Path(__file__).parent.parent.parent.parent.parent  # src directory
-sys.path.insert(0, str(project_root))
+project_root = Path(__file__).resolve().parents[5]  # src directory
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 # Import our modules
 from cryptotrader.config import get_logger
@@ -74,7 +74,7 @@ def main():
             )
     except Exception as e:
         logger.error(f"{Fore.RED}Error retrieving supported coin pairs: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 2: Request for Quote simulation
     print_test_header("Requesting OTC Quote (Simulation)")
@@ -122,7 +122,7 @@ def main():
             logger.warning(f"{Fore.YELLOW}Could not request quote: {str(e)}")
     except Exception as e:
         logger.error(f"{Fore.RED}Error in quote request simulation: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 3: Place Order simulation
     print_test_header("Placing OTC Order (Simulation)")
@@ -150,7 +150,7 @@ def main():
         )
     except Exception as e:
         logger.error(f"{Fore.RED}Error in order placement simulation: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 4: Get Order simulation
     print_test_header("Getting OTC Order (Simulation)")
@@ -190,7 +190,7 @@ def main():
             logger.warning(f"{Fore.YELLOW}Could not retrieve order: {str(e)}")
     except Exception as e:
         logger.error(f"{Fore.RED}Error in get order simulation: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 5: List Orders simulation
     print_test_header("Listing OTC Orders (Simulation)")
@@ -241,7 +241,7 @@ def main():
             logger.warning(f"{Fore.YELLOW}Could not retrieve orders list: {str(e)}")
     except Exception as e:
         logger.error(f"{Fore.RED}Error in list orders simulation: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 6: Get OCBS Orders simulation
     print_test_header("Listing OCBS Orders (Simulation)")
@@ -298,7 +298,7 @@ def main():
             )
     except Exception as e:
         logger.error(f"{Fore.RED}Error in list OCBS orders simulation: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Summary
     logger.info("\nOTC API Diagnostic Summary:")
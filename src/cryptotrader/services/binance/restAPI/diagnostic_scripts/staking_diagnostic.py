@@ -10,7 +10,6 @@ Usage:
 
 import sys
 import time
-import traceback
 from pathlib import Path
 from datetime import datetime, timedelta
 from colorama import Fore, Style, init
@@ -19,8 +18,9 @@ from colorama import Fore, Style, init
 init(autoreset=True)
 
 # Add the src directory to the Python path
-project_root = Path(__file__).parent.parent.parent.parent.parent  # src directory
-sys.path.insert(0, str(project_root))
+project_root = Path(__file__).resolve().parents[5]  # src directory
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 # Import our modules
 from cryptotrader.config import get_logger
@@ -68,7 +68,7 @@ def main():
             )
     except Exception as e:
         logger.error(f"{Fore.RED}Error retrieving staking asset information: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 2: Stake Asset Simulation
     print_test_header("Stake Asset Simulation (No Actual Staking)")
@@ -103,7 +103,7 @@ def main():
             logger.warning(f"{Fore.YELLOW}Could not make stake request: {str(e)}")
     except Exception as e:
         logger.error(f"{Fore.RED}Error in stake simulation: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 3: Unstake Asset Simulation
     print_test_header("Unstake Asset Simulation (No Actual Unstaking)")
@@ -136,7 +136,7 @@ def main():
             logger.warning(f"{Fore.YELLOW}Could not make unstake request: {str(e)}")
     except Exception as e:
         logger.error(f"{Fore.RED}Error in unstake simulation: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 4: Get Staking Balance
     print_test_header("Getting Staking Balance")
@@ -167,7 +167,7 @@ def main():
             )
     except Exception as e:
         logger.error(f"{Fore.RED}Error retrieving staking balance: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 5: Get Staking History
     print_test_header("Getting Staking History")
@@ -201,7 +201,7 @@ def main():
             )
     except Exception as e:
         logger.error(f"{Fore.RED}Error retrieving staking history: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 6: Get Staking Rewards History
     print_test_header("Getting Staking Rewards History")
@@ -245,7 +245,7 @@ def main():
             )
     except Exception as e:
         logger.error(f"{Fore.RED}Error retrieving staking rewards history: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Summary
     logger.info("\nStaking API Diagnostic Summary:")
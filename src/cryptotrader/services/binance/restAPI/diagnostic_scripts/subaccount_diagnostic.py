@@ -9,7 +9,6 @@ Usage:
 """
 
 import sys
-import traceback
 from pathlib import Path
 from colorama import Fore, Style, init
 
@@ -17,8 +16,9 @@ from colorama import Fore, Style, init
 init(autoreset=True)
 
 # Add the src directory to the Python path
-project_root = Path(__file__).parent.parent.parent.parent.parent  # src directory
-sys.path.insert(0, str(project_root))
+project_root = Path(__file__).resolve().parents[5]  # src directory
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 # Import our modules
 from cryptotrader.config import get_logger
@@ -61,7 +61,7 @@ def main():
             )
     except Exception as e:
         logger.error(f"{Fore.RED}Error retrieving sub-account list: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 2: Get sub-account transfer history
     print_test_header("Getting sub-account transfer history")
@@ -89,7 +89,7 @@ def main():
         logger.error(
             f"{Fore.RED}Error retrieving sub-account transfer history: {str(e)}"
         )
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Note about sub-account tests requiring specific emails
     logger.info(
@@ -125,7 +125,7 @@ def main():
             )
     except Exception as e:
         logger.error(f"{Fore.RED}Error retrieving sub-account assets: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 4: Get master account total value
     print_test_header("Getting master account total value")
@@ -152,7 +152,7 @@ def main():
             )
     except Exception as e:
         logger.error(f"{Fore.RED}Error retrieving master account total value: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 5: Get sub-account status list (would require a valid email)
     print_test_header("Getting sub-account status list")
@@ -179,7 +179,7 @@ def main():
             )
     except Exception as e:
         logger.error(f"{Fore.RED}Error retrieving sub-account status list: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Note about transfer execution
     logger.info(
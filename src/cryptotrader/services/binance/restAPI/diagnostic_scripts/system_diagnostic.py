@@ -11,7 +11,6 @@ Usage:
 import sys
 from pathlib import Path
 import time
-import traceback
 from datetime import datetime
 from colorama import Fore, Style, init
 
@@ -19,8 +18,9 @@ from colorama import Fore, Style, init
 init(autoreset=True)
 
 # Add the src directory to the Python path
-project_root = Path(__file__).parent.parent.parent.parent.parent  # src directory
-sys.path.insert(0, str(project_root))
+project_root = Path(__file__).resolve().parents[5]  # src directory
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 # Import our modules
 from cryptotrader.config import get_logger
@@ -68,7 +68,7 @@ def main():
             )
     except Exception as e:
         logger.error(f"Error retrieving server time: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 2: Get system status
     print_test_header("Checking system status")
@@ -86,7 +86,7 @@ def main():
             logger.error(f"{Fore.RED}Unknown system status!")
     except Exception as e:
         logger.error(f"Error retrieving system status: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 3: Get available symbols
     print_test_header("Getting available trading symbols")
@@ -107,7 +107,7 @@ def main():
             logger.info(f"Sample of 5 random symbols: {', '.join(sample)}")
     except Exception as e:
         logger.error(f"Error retrieving trading symbols: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 4: Get exchange information for a specific symbol
     print_test_header("Getting exchange info for BTC/USDT")
@@ -127,7 +127,7 @@ def main():
             logger.error("Failed to retrieve symbol information for BTCUSDT")
     except Exception as e:
         logger.error(f"Error retrieving symbol information: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 5: Get self-trade prevention modes
     print_test_header("Getting self-trade prevention modes")
@@ -142,7 +142,7 @@ def main():
             logger.error("Failed to retrieve self-trade prevention modes")
     except Exception as e:
         logger.error(f"Error retrieving self-trade prevention modes: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 6: Get full exchange information
     print_test_header("Getting complete exchange information")
@@ -174,7 +174,7 @@ def main():
             logger.error("Failed to retrieve exchange information")
     except Exception as e:
         logger.error(f"Error retrieving exchange information: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
 
 if __name__ == "__main__":
@@ -8,8 +8,8 @@ Usage:
     python src/cryptotrader/services/binance/diagnostic_scripts/user_diagnostic.py
 """
 
+import logging
 import sys
-import traceback
 from pathlib import Path
 from colorama import Fore, Style, init
 
@@ -17,8 +17,9 @@ from colorama import Fore, Style, init
 init(autoreset=True)
 
 # Add the src directory to the Python path
-project_root = Path(__file__).parent.parent.parent.parent.parent  # src directory
-sys.path.insert(0, str(project_root))
+project_root = Path(__file__).resolve().parents[5]  # src directory
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 # Import our modules
 from cryptotrader.config import get_logger
@@ -29,11 +30,11 @@ logger = get_logger(__name__)
 
 def print_test_header(test_name):
     """Print a test header in cyan color"""
-    logger.info(f"\n{Fore.CYAN}Test: {test_name}{Style.RESET_ALL}")
+    logger.info("\n%sTest: %s%s", Fore.CYAN, test_name, Style.RESET_ALL)
 
 
 def main():
-    logger.info(f"Added {project_root} to Python path")
+    logger.info("Added %s to Python path", project_root)
 
     logger.info("Initializing Binance User client...")
     client = UserOperations()  # No need to pass API credentials
@@ -43,40 +44,42 @@ def main():
     try:
         account = client.getAccountRest()
         if account and account.assets:
-            logger.info(f"{Fore.GREEN}Account information retrieved successfully")
-            # Print assets with non-zero balances
-            non_zero_assets = {
-                asset: data
-                for asset, data in account.assets.items()
-                if float(data.free) > 0 or float(data.locked) > 0
-            }
-
-            if non_zero_assets:
-                logger.info("Assets with non-zero balance:")
-                for asset, data in non_zero_assets.items():
-                    logger.info(f"  {asset}: Free={data.free}, Locked={data.locked}")
-            else:
-                logger.info("No assets with non-zero balance found")
+            logger.info("%sAccount information retrieved successfully", Fore.GREEN)
+            # Print assets with non-zero balances (skipped entirely when INFO is off)
+            if logger.isEnabledFor(logging.INFO):
+                any_printed = False
+                for asset, data in account.assets.items():
+                    if float(data.free) > 0 or float(data.locked) > 0:
+                        if not any_printed:
+                            logger.info("Assets with non-zero balance:")
+                            any_printed = True
+                        logger.info(
+                            "  %s: Free=%s, Locked=%s", asset, data.free, data.locked
+                        )
+
+                if not any_printed:
+                    logger.info("No assets with non-zero balance found")
         else:
-            logger.warning(f"{Fore.YELLOW}No account data retrieved or empty response")
+            logger.warning("%sNo account data retrieved or empty response", Fore.YELLOW)
     except Exception as e:
-        logger.error(f"{Fore.RED}Error retrieving account information: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.error("%sError retrieving account information: %s", Fore.RED, e)
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 2: Get account status
     print_test_header("Getting account status")
     try:
         status = client.getAccountRestStatus()
         if status:
-            logger.info(f"Account status: {status.get('msg', 'Unknown')}")
-            logger.info(f"Success: {status.get('success', False)}")
+            logger.info("Account status: %s", status.get('msg', 'Unknown'))
+            logger.info("Success: %s", status.get('success', False))
         else:
             logger.warning(
-                f"{Fore.YELLOW}No account status retrieved or empty response"
+                "%sNo account status retrieved or empty response",
+                Fore.YELLOW,
             )
     except Exception as e:
-        logger.error(f"{Fore.RED}Error retrieving account status: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.error("%sError retrieving account status: %s", Fore.RED, e)
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 3: Get API trading status
     print_test_header("Getting API trading status")
@@ -84,24 +87,28 @@ def main():
         trading_status = client.getApiTradingStatus()
         if trading_status and trading_status.get("success"):
             status_details = trading_status.get("status", {})
-            logger.info(f"API trading locked: {status_details.get('isLocked', False)}")
-            logger.info(f"Update time: {status_details.get('updateTime', 0)}")
+            logger.info("API trading locked: %s", status_details.get('isLocked', False))
+            logger.info("Update time: %s", status_details.get('updateTime', 0))
 
             # Get some indicators if available
             indicators = status_details.get("indicators", {})
             for symbol, indicator_list in indicators.items():
-                logger.info(f"Indicators for {symbol}:")
+                logger.info("Indicators for %s:", symbol)
                 for indicator in indicator_list:
                     logger.info(
-                        f"  {indicator.get('i')}: Value={indicator.get('v')}, Trigger={indicator.get('t')}"
+                        "  %s: Value=%s, Trigger=%s",
+                        indicator.get('i'),
+                        indicator.get('v'),
+                        indicator.get('t'),
                     )
         else:
             logger.warning(
-                f"{Fore.YELLOW}No API trading status retrieved or empty response"
+                "%sNo API trading status retrieved or empty response",
+                Fore.YELLOW,
             )
     except Exception as e:
-        logger.error(f"{Fore.RED}Error retrieving API trading status: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.error("%sError retrieving API trading status: %s", Fore.RED, e)
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 4: Get trading fee
     print_test_header("Getting trading fee for BTC/USDT")
@@ -109,16 +116,17 @@ def main():
         fees = client.getTradeFee(symbol="BTCUSDT")
         if fees and len(fees) > 0:
             for fee in fees:
-                logger.info(f"Symbol: {fee.get('symbol')}")
-                logger.info(f"  Maker commission: {fee.get('makerCommission')}")
-                logger.info(f"  Taker commission: {fee.get('takerCommission')}")
+                logger.info("Symbol: %s", fee.get('symbol'))
+                logger.info("  Maker commission: %s", fee.get('makerCommission'))
+                logger.info("  Taker commission: %s", fee.get('takerCommission'))
         else:
             logger.warning(
-                f"{Fore.YELLOW}No trading fee data retrieved or empty response"
+                "%sNo trading fee data retrieved or empty response",
+                Fore.YELLOW,
             )
     except Exception as e:
-        logger.error(f"{Fore.RED}Error retrieving trading fee: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.error("%sError retrieving trading fee: %s", Fore.RED, e)
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 5: Get trading volume
     print_test_header("Getting past 30 days trading volume")
@@ -126,15 +134,17 @@ def main():
         volume = client.getTradingVolume()
         if volume:
             logger.info(
-                f"Past 30 days trading volume: {volume.get('past30DaysTradingVolume', 'Unknown')}"
+                "Past 30 days trading volume: %s",
+                volume.get('past30DaysTradingVolume', 'Unknown'),
             )
         else:
             logger.warning(
-                f"{Fore.YELLOW}No trading volume data retrieved or empty response"
+                "%sNo trading volume data retrieved or empty response",
+                Fore.YELLOW,
             )
     except Exception as e:
-        logger.error(f"{Fore.RED}Error retrieving trading volume: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.error("%sError retrieving trading volume: %s", Fore.RED, e)
+        logger.debug("Traceback:", exc_info=True)
 
     # Test 6: Get asset distribution history
     print_test_header("Getting asset distribution history")
@@ -142,21 +152,22 @@ def main():
         distribution = client.getAssetDistributionHistory(limit=5)
         if distribution and distribution.get("success"):
             distributions = distribution.get("results", [])
-            logger.info(f"Retrieved {len(distributions)} asset distributions")
+            logger.info("Retrieved %s asset distributions", len(distributions))
 
             for i, dist in enumerate(distributions[:3]):  # Show first 3
-                logger.info(f"Distribution {i + 1}:")
-                logger.info(f"  Asset: {dist.get('asset', 'Unknown')}")
-                logger.info(f"  Amount: {dist.get('amount', 'Unknown')}")
-                logger.info(f"  Category: {dist.get('category', 'Unknown')}")
-                logger.info(f"  Time: {dist.get('time', 'Unknown')}")
+                logger.info("Distribution %s:", i + 1)
+                logger.info("  Asset: %s", dist.get('asset', 'Unknown'))
+                logger.info("  Amount: %s", dist.get('amount', 'Unknown'))
+                logger.info("  Category: %s", dist.get('category', 'Unknown'))
+                logger.info("  Time: %s", dist.get('time', 'Unknown'))
         else:
             logger.warning(
-                f"{Fore.YELLOW}No asset distribution history retrieved or empty response"
+                "%sNo asset distribution history retrieved or empty response",
+                Fore.YELLOW,
             )
     except Exception as e:
-        logger.error(f"{Fore.RED}Error retrieving asset distribution history: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.error("%sError retrieving asset distribution history: %s", Fore.RED, e)
+        logger.debug("Traceback:", exc_info=True)
 
     # Summary
     logger.info("\nUser API Diagnostic Summary:")
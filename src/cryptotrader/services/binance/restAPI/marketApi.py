@@ -141,22 +141,32 @@ class MarketOperations:
 
         response = request.execute()
 
-        candles = []
-        if response:
-            for candle_data in response:
-                candles.append(
-                    Candle(
-                        timestamp=candle_data[0],
-                        openPrice=float(candle_data[1]),
-                        highPrice=float(candle_data[2]),
-                        lowPrice=float(candle_data[3]),
-                        closePrice=float(candle_data[4]),
-                        volume=float(candle_data[5]),
-                        quoteVolume=float(candle_data[7]),
-                    )
-                )
-
-        return candles
+        if not response:
+            return []
+
+        # Kline rows: [openTime, open, high, low, close, volume, closeTime, quoteVolume, ...]
+        return [
+            Candle(
+                open_time,
+                float(open_price),
+                float(high_price),
+                float(low_price),
+                float(close_price),
+                float(volume),
+                float(quote_volume),
+            )
+            for (
+                open_time,
+                open_price,
+                high_price,
+                low_price,
+                close_price,
+                volume,
+                _,
+                quote_volume,
+                *_,
+            ) in response
+        ]
 
     def getRecentTradesRest(self, symbol: str, limit: int = 500) -> List[Trade]:
         """
@@ -14,7 +14,7 @@ than specific market data or trading operations.
 
 import json
 import time
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Tuple
 
 from cryptotrader.config import get_logger
 from cryptotrader.services.binance.models.base_models import (
@@ -23,10 +23,18 @@ from cryptotrader.services.binance.models.base_models import (
     SymbolStatus,
 )
 from cryptotrader.services.binance.models import SystemStatus, RateLimitType
-from cryptotrader.services.binance.restAPI.baseOperations import BinanceAPIRequest
+from cryptotrader.services.binance.restAPI.baseOperations import (
+    BinanceAPIRequest,
+    timestampMs,
+)
 
 logger = get_logger(__name__)
 
+# exchangeInfo is ~1MB and changes rarely, so the unfiltered response is shared
+# by every SystemOperations instance and refetched at most once per TTL
+_EXCHANGE_INFO_TTL = 60.0
+_exchange_info_cache: Optional[Tuple[float, ExchangeInfo]] = None
+
 
 class SystemOperations:
     """
@@ -39,10 +47,6 @@ class SystemOperations:
       - get_binance_symbols(): cached Set[str] of symbols
     """
 
-    def __init__(self):
-        # In-memory cache for the last-fetched ExchangeInfo
-        self._exchange_info_cache: Optional[ExchangeInfo] = None
-
     def request(
         self,
         method: str,
@@ -69,7 +73,7 @@ class SystemOperations:
         )
         if isinstance(resp, dict) and "serverTime" in resp:
             return int(resp["serverTime"])
-        return int(time.time() * 1000)
+        return timestampMs()
 
     def getSystemStatus(self) -> SystemStatus:
         """
@@ -146,16 +150,29 @@ class SystemOperations:
         Clears the cached ExchangeInfo.
         Next call to get_binance_symbols or get_symbols will fetch fresh data.
         """
-        self._exchange_info_cache = None
+        global _exchange_info_cache
+        _exchange_info_cache = None
+
+    def _cachedExchangeInfo(self) -> ExchangeInfo:
+        """
+        Returns the unfiltered ExchangeInfo, refetching it once the cached
+        copy is older than _EXCHANGE_INFO_TTL seconds.
+        """
+        global _exchange_info_cache
+        now = time.monotonic()
+        if (
+            _exchange_info_cache is None
+            or now - _exchange_info_cache[0] > _EXCHANGE_INFO_TTL
+        ):
+            _exchange_info_cache = (now, self.getExchangeInfo())
+        return _exchange_info_cache[1]
 
     def get_symbols(self) -> Dict[str, SymbolInfo]:
         """
         Returns a dict mapping symbol string → SymbolInfo object for all symbols.
         Uses cached ExchangeInfo if available.
         """
-        if self._exchange_info_cache is None:
-            self._exchange_info_cache = self.getExchangeInfo()
-        return {s.symbol: s for s in self._exchange_info_cache.symbols}
+        return {s.symbol: s for s in self._cachedExchangeInfo().symbols}
 
     def get_binance_symbols(self, only_trading: bool = True) -> Set[str]:
         """
@@ -166,10 +183,7 @@ class SystemOperations:
 
         Uses in-memory cache; call refresh_exchange_info() to refetch.
         """
-        if self._exchange_info_cache is None:
-            self._exchange_info_cache = self.getExchangeInfo()
-
-        symbols = self._exchange_info_cache.symbols
+        symbols = self._cachedExchangeInfo().symbols
         if only_trading:
             return {s.symbol for s in symbols if s.status == SymbolStatus.TRADING}
         return {s.symbol for s in symbols}
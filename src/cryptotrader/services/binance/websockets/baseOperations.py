@@ -14,8 +14,6 @@ It handles:
 
 import json
 import time
-import hmac
-import hashlib
 import asyncio
 import uuid
 from typing import Dict, List, Optional, Any, Union, Callable, Awaitable
@@ -26,7 +24,11 @@ import websockets
 from websockets.exceptions import ConnectionClosed
 
 from cryptotrader.config import get_logger, Secrets
-from cryptotrader.services.binance.restAPI.baseOperations import RateLimiter
+from cryptotrader.services.binance.restAPI.baseOperations import (
+    RateLimiter,
+    signPayload,
+    timestampMs,
+)
 from cryptotrader.services.binance.models import (
     RateLimit,
     RateLimitType,
@@ -35,6 +37,50 @@ from cryptotrader.services.binance.models import (
 
 logger = get_logger(__name__)
 
+try:
+    # Optional: orjson parses small JSON frames several times faster than the stdlib
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+
+def decode_message(message: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON WebSocket frame.
+
+    Uses orjson when it is installed and falls back to the standard library.
+    Both raise a json.JSONDecodeError subclass on malformed input.
+
+    Args:
+        message: Raw text or binary frame received from the socket
+
+    Returns:
+        Decoded JSON value
+    """
+    return _json_loads(message)
+
+
+def encode_message(message: Any) -> str:
+    """
+    Serialize a request payload for sending as a text WebSocket frame.
+
+    Uses orjson when it is installed and falls back to the standard library.
+
+    Args:
+        message: JSON-serializable request payload
+
+    Returns:
+        JSON text
+    """
+    return _json_dumps(message)
+
 
 class SecurityType(str, Enum):
     """Security types for Binance API endpoints"""
@@ -137,8 +183,8 @@ class BinanceWebSocketConnection:
             return True
 
         # Check if we're banned
-        if self.ip_banned_until and time.time() * 1000 < self.ip_banned_until:
-            ban_remaining_secs = (self.ip_banned_until - time.time() * 1000) / 1000
+        if self.ip_banned_until and timestampMs() < self.ip_banned_until:
+            ban_remaining_secs = (self.ip_banned_until - timestampMs()) / 1000
             logger.warning(
                 f"IP banned, cannot connect for {ban_remaining_secs:.1f} more seconds"
             )
@@ -213,8 +259,8 @@ class BinanceWebSocketConnection:
                 if self.is_connected:
                     ping_id = str(uuid.uuid4())
                     ping_message = {"id": ping_id, "method": "ping"}
-                    await self.websocket.send(json.dumps(ping_message))
-                    logger.debug(f"Sent ping message with ID: {ping_id}")
+                    await self.websocket.send(encode_message(ping_message))
+                    logger.debug("Sent ping message with ID: %s", ping_id)
 
                     # Wait for pong response (handled in _receiveLoop)
                     # If no activity for pong_timeout, we'll reconnect
@@ -270,7 +316,7 @@ class BinanceWebSocketConnection:
 
                 # Parse the message
                 if message:
-                    parsed_message = json.loads(message)
+                    parsed_message = decode_message(message)
 
                     # Update rate limits if included
                     if "rateLimits" in parsed_message:
@@ -339,8 +385,8 @@ class BinanceWebSocketConnection:
             return
 
         # Check if we're IP banned
-        if self.ip_banned_until and time.time() * 1000 < self.ip_banned_until:
-            ban_remaining_secs = (self.ip_banned_until - time.time() * 1000) / 1000
+        if self.ip_banned_until and timestampMs() < self.ip_banned_until:
+            ban_remaining_secs = (self.ip_banned_until - timestampMs()) / 1000
             logger.warning(
                 f"IP banned, delaying reconnection for {ban_remaining_secs:.1f} seconds"
             )
@@ -353,8 +399,8 @@ class BinanceWebSocketConnection:
             self.ip_banned_until = None
 
         # Check if we're rate limited
-        elif self.retry_after and time.time() * 1000 < self.retry_after:
-            retry_secs = (self.retry_after - time.time() * 1000) / 1000
+        elif self.retry_after and timestampMs() < self.retry_after:
+            retry_secs = (self.retry_after - timestampMs()) / 1000
             logger.warning(
                 f"Rate limited, delaying reconnection for {retry_secs:.1f} seconds"
             )
@@ -450,7 +496,7 @@ class BinanceWebSocketConnection:
                 logger.error("WebSocket error: Auto-banned for rate limit violations")
                 if self.retry_after:
                     self.ip_banned_until = self.retry_after
-                    ban_duration_mins = (self.retry_after - time.time() * 1000) / (
+                    ban_duration_mins = (self.retry_after - timestampMs()) / (
                         60 * 1000
                     )
                     logger.error(
@@ -460,7 +506,7 @@ class BinanceWebSocketConnection:
                 # Rate limit exceeded
                 logger.warning("WebSocket error: Rate limit exceeded")
                 if self.retry_after:
-                    retry_seconds = (self.retry_after - time.time() * 1000) / 1000
+                    retry_seconds = (self.retry_after - timestampMs()) / 1000
                     logger.warning(
                         f"Rate limit exceeded, retry after: {self.retry_after} (in {retry_seconds:.1f} seconds)"
                     )
@@ -529,15 +575,15 @@ class BinanceWebSocketConnection:
             raise ConnectionError("WebSocket is not connected")
 
         # Check for IP ban
-        if self.ip_banned_until and time.time() * 1000 < self.ip_banned_until:
-            ban_remaining_secs = (self.ip_banned_until - time.time() * 1000) / 1000
+        if self.ip_banned_until and timestampMs() < self.ip_banned_until:
+            ban_remaining_secs = (self.ip_banned_until - timestampMs()) / 1000
             raise Exception(
                 f"IP banned, cannot send request for {ban_remaining_secs:.1f} more seconds"
             )
 
         # Check for rate limit retry-after
-        if self.retry_after and time.time() * 1000 < self.retry_after:
-            retry_remaining_secs = (self.retry_after - time.time() * 1000) / 1000
+        if self.retry_after and timestampMs() < self.retry_after:
+            retry_remaining_secs = (self.retry_after - timestampMs()) / 1000
             raise Exception(
                 f"Rate limited, retry after {retry_remaining_secs:.1f} more seconds"
             )
@@ -546,13 +592,8 @@ class BinanceWebSocketConnection:
         if security_type in (SecurityType.TRADE, SecurityType.USER_DATA):
             return await self.send_signed(method, params, return_rate_limits)
         elif security_type in (SecurityType.USER_STREAM, SecurityType.MARKET_DATA):
-            # Add API key to params
-            if params is None:
-                params = {}
-            else:
-                # Make a copy to avoid modifying the original
-                params = params.copy()
-            params["apiKey"] = Secrets.BINANCE_API_KEY
+            # Add API key to a copy of params so the caller's dict is untouched
+            params = {**(params or {}), "apiKey": Secrets.BINANCE_API_KEY}
 
         # Generate message ID
         msg_id = str(self.message_id)
@@ -573,8 +614,8 @@ class BinanceWebSocketConnection:
             message["params"] = msg_params
 
         # Send the message
-        await self.websocket.send(json.dumps(message))
-        logger.debug(f"Sent WebSocket request: method={method}, id={msg_id}")
+        await self.websocket.send(encode_message(message))
+        logger.debug("Sent WebSocket request: method=%s, id=%s", method, msg_id)
         return msg_id
 
     async def send_signed(
@@ -608,15 +649,15 @@ class BinanceWebSocketConnection:
             raise ConnectionError("WebSocket is not connected")
 
         # Check for IP ban
-        if self.ip_banned_until and time.time() * 1000 < self.ip_banned_until:
-            ban_remaining_secs = (self.ip_banned_until - time.time() * 1000) / 1000
+        if self.ip_banned_until and timestampMs() < self.ip_banned_until:
+            ban_remaining_secs = (self.ip_banned_until - timestampMs()) / 1000
             raise Exception(
                 f"IP banned, cannot send request for {ban_remaining_secs:.1f} more seconds"
             )
 
         # Check for rate limit retry-after
-        if self.retry_after and time.time() * 1000 < self.retry_after:
-            retry_remaining_secs = (self.retry_after - time.time() * 1000) / 1000
+        if self.retry_after and timestampMs() < self.retry_after:
+            retry_remaining_secs = (self.retry_after - timestampMs()) / 1000
             raise Exception(
                 f"Rate limited, retry after {retry_remaining_secs:.1f} more seconds"
             )
@@ -625,16 +666,12 @@ class BinanceWebSocketConnection:
         msg_id = str(self.message_id)
         self.message_id += 1
 
-        # Create params if not provided
-        if params is None:
-            params = {}
-        else:
-            # Make a copy to avoid modifying the original
-            params = params.copy()
-
-        # Add timestamp and API key
-        params["timestamp"] = int(time.time() * 1000)
-        params["apiKey"] = Secrets.BINANCE_API_KEY
+        # Add timestamp and API key to a copy of params so the caller's dict is untouched
+        params = {
+            **(params or {}),
+            "timestamp": timestampMs(),
+            "apiKey": Secrets.BINANCE_API_KEY,
+        }
 
         # Handle rate limits return preference if specified
         if return_rate_limits is not None:
@@ -642,22 +679,21 @@ class BinanceWebSocketConnection:
 
         # Generate signature
         # Sort parameters alphabetically as required by Binance
-        query_string = "&".join([f"{k}={v}" for k, v in sorted(params.items())])
-        signature = hmac.new(
-            Secrets.BINANCE_API_SECRET.encode("utf-8"),
-            query_string.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
+        payload = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
 
         # Add signature to params
-        params["signature"] = signature
+        params["signature"] = signPayload(
+            Secrets.BINANCE_API_SECRET, payload.encode("utf-8")
+        )
 
         # Create message
         message = {"id": msg_id, "method": method, "params": params}
 
         # Send the message
-        await self.websocket.send(json.dumps(message))
-        logger.debug(f"Sent signed WebSocket request: method={method}, id={msg_id}")
+        await self.websocket.send(encode_message(message))
+        logger.debug(
+            "Sent signed WebSocket request: method=%s, id=%s", method, msg_id
+        )
         return msg_id
 
     async def close(self):
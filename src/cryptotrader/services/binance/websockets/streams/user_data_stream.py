@@ -62,6 +62,18 @@ class UserDataStream:
         self.on_balance_update = on_balance_update
         self.on_error = on_error
         self.ping_interval = ping_interval
+
+        # Event type -> callback, so each message is routed with one dict lookup
+        self._event_handlers = {
+            event_type: handler
+            for event_type, handler in (
+                ("outboundAccountPosition", on_account_update),
+                ("executionReport", on_order_update),
+                ("listStatus", on_oco_update),
+                ("balanceUpdate", on_balance_update),
+            )
+            if handler
+        }
         self.use_combined_stream = use_combined_stream
 
         # Stream state
@@ -292,23 +304,17 @@ class UserDataStream:
         Args:
             data: WebSocket message data
         """
-        if not data or "e" not in data:
+        event_type = data.get("e") if data else None
+        if event_type is None:
             logger.warning(f"Received invalid user data message: {data}")
             return
 
-        event_type = data["e"]
-
         try:
-            if event_type == "outboundAccountPosition" and self.on_account_update:
-                await self.on_account_update(data)
-            elif event_type == "executionReport" and self.on_order_update:
-                await self.on_order_update(data)
-            elif event_type == "listStatus" and self.on_oco_update:
-                await self.on_oco_update(data)
-            elif event_type == "balanceUpdate" and self.on_balance_update:
-                await self.on_balance_update(data)
+            handler = self._event_handlers.get(event_type)
+            if handler:
+                await handler(data)
             else:
-                logger.debug(f"Unhandled user data event type: {event_type}")
+                logger.debug("Unhandled user data event type: %s", event_type)
 
         except Exception as e:
             logger.error(f"Error processing user data message: {str(e)}")
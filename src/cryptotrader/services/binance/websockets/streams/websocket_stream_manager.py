@@ -7,15 +7,23 @@ It handles subscribing, unsubscribing, and processing messages from Binance WebS
 
 import json
 import asyncio
+import itertools
 from typing import Dict, List, Optional, Any, Callable, Awaitable, Union
 
 import websockets
 from websockets.exceptions import ConnectionClosed
 
 from cryptotrader.config import get_logger, Secrets
+from cryptotrader.services.binance.websockets.baseOperations import (
+    decode_message,
+    encode_message,
+)
 
 logger = get_logger(__name__)
 
+# SUBSCRIBE/UNSUBSCRIBE frames only differ in method, stream names and id
+_SUBSCRIPTION_FRAME = '{"method":"%s","params":[%s],"id":%d}'
+
 
 class BinanceStreamManager:
     """
@@ -72,7 +80,7 @@ class BinanceStreamManager:
 
         # Stream state
         self.subscribed_streams = set()
-        self.message_id = 1
+        self._message_ids = itertools.count(1)
         self.message_callbacks = {}
 
         # Tasks
@@ -96,7 +104,8 @@ class BinanceStreamManager:
             return True
 
         try:
-            # Determine URL based on current subscriptions and settings
+            # Determine URL based on current subscriptions and settings; every
+            # tracked stream is carried in the URL, so no SUBSCRIBE is needed after
             if self.use_combined_stream:
                 if self.subscribed_streams:
                     streams_param = "/".join(self.subscribed_streams)
@@ -138,15 +147,6 @@ class BinanceStreamManager:
 
             logger.info(f"WebSocket connection established to {url}")
 
-            # If we have streams and connected to a base endpoint, subscribe now
-            if self.subscribed_streams and (
-                (self.use_combined_stream and "streams" not in url)
-                or (not self.use_combined_stream and "stream_name" not in url)
-            ):
-                await self._send_subscription_request(
-                    list(self.subscribed_streams), True
-                )
-
             return True
 
         except Exception as e:
@@ -243,8 +243,7 @@ class BinanceStreamManager:
         """
         if self.is_connected and self.use_combined_stream:
             # We can query the server for current subscriptions
-            msg_id = self.message_id
-            self.message_id += 1
+            msg_id = next(self._message_ids)
 
             # Create a future to wait for the response
             future = asyncio.get_running_loop().create_future()
@@ -252,7 +251,7 @@ class BinanceStreamManager:
 
             # Send the request
             request = {"method": "LIST_SUBSCRIPTIONS", "id": msg_id}
-            await self.websocket.send(json.dumps(request))
+            await self.websocket.send(encode_message(request))
 
             try:
                 # Wait for the response with a timeout
@@ -298,8 +297,7 @@ class BinanceStreamManager:
             logger.error(f"Unsupported property: {property_name}")
             return False
 
-        msg_id = self.message_id
-        self.message_id += 1
+        msg_id = next(self._message_ids)
 
         # Create a future to wait for the response
         future = asyncio.get_running_loop().create_future()
@@ -311,7 +309,7 @@ class BinanceStreamManager:
             "params": [property_name, property_value],
             "id": msg_id,
         }
-        await self.websocket.send(json.dumps(request))
+        await self.websocket.send(encode_message(request))
 
         try:
             # Wait for the response with a timeout
@@ -349,8 +347,7 @@ class BinanceStreamManager:
             logger.error(f"Unsupported property: {property_name}")
             return None
 
-        msg_id = self.message_id
-        self.message_id += 1
+        msg_id = next(self._message_ids)
 
         # Create a future to wait for the response
         future = asyncio.get_running_loop().create_future()
@@ -358,7 +355,7 @@ class BinanceStreamManager:
 
         # Send the request
         request = {"method": "GET_PROPERTY", "params": [property_name], "id": msg_id}
-        await self.websocket.send(json.dumps(request))
+        await self.websocket.send(encode_message(request))
 
         try:
             # Wait for the response with a timeout
@@ -428,16 +425,15 @@ class BinanceStreamManager:
             return False
 
         method = "SUBSCRIBE" if subscribe else "UNSUBSCRIBE"
-        msg_id = self.message_id
-        self.message_id += 1
+        msg_id = next(self._message_ids)
 
         # Create a future to wait for the response
         future = asyncio.get_running_loop().create_future()
         self.message_callbacks[str(msg_id)] = lambda data: future.set_result(data)
 
-        # Send the request
-        request = {"method": method, "params": streams, "id": msg_id}
-        await self.websocket.send(json.dumps(request))
+        # Send the request; stream names are plain ASCII and need no JSON escaping
+        params = ",".join(f'"{stream}"' for stream in streams)
+        await self.websocket.send(_SUBSCRIPTION_FRAME % (method, params, msg_id))
 
         try:
             # Wait for the response with a timeout
@@ -511,26 +507,29 @@ class BinanceStreamManager:
                 # Parse and process the message
                 if message:
                     try:
-                        data = json.loads(message)
+                        data = decode_message(message)
+
+                        # One lookup per key; array payloads (e.g. !ticker@arr)
+                        # are always stream data
+                        is_object = isinstance(data, dict)
+                        msg_id = data.get("id") if is_object else None
 
                         # Handle response messages (with ID)
-                        if "id" in data:
-                            msg_id = str(data["id"])
-                            if msg_id in self.message_callbacks:
-                                callback = self.message_callbacks.pop(msg_id)
+                        if msg_id is not None:
+                            callback = self.message_callbacks.pop(str(msg_id), None)
+                            if callback:
                                 callback(data)
 
                         # Handle stream data messages
                         elif self.on_message:
-                            if (
-                                self.use_combined_stream
-                                and "stream" in data
-                                and "data" in data
-                            ):
+                            stream_name = (
+                                data.get("stream")
+                                if is_object and self.use_combined_stream
+                                else None
+                            )
+                            if stream_name is not None and "data" in data:
                                 # Combined stream format
-                                stream_name = data["stream"]
-                                payload = data["data"]
-                                await self.on_message(stream_name, payload)
+                                await self.on_message(stream_name, data["data"])
                             else:
                                 # Single stream format - use the first subscription as the name
                                 if self.subscribed_streams:
@@ -542,7 +541,7 @@ class BinanceStreamManager:
                                     )
 
                     except json.JSONDecodeError:
-                        logger.error(f"Failed to parse WebSocket message: {message}")
+                        logger.error("Failed to parse WebSocket message: %s", message)
 
             except websockets.exceptions.ConnectionClosed as e:
                 if not self.is_closing:
@@ -627,12 +626,8 @@ class BinanceStreamManager:
         )
         await asyncio.sleep(wait_time)
 
-        # Attempt to reconnect
-        success = await self.connect()
-
-        # If reconnected successfully, resubscribe to streams
-        if success and self.subscribed_streams:
-            await self._send_subscription_request(list(self.subscribed_streams), True)
+        # Attempt to reconnect; connect() puts the tracked streams in the URL
+        await self.connect()
 
 
 async def createMarketStream(
@@ -663,16 +658,17 @@ async def createMarketStream(
         on_message=on_message, use_combined_stream=use_combined_stream
     )
 
-    # Connect
-    await manager.connect()
-
     # Create stream names (symbol@channel)
-    streams = []
-    for symbol in symbols:
-        for channel in channels:
-            streams.append(f"{symbol}@{channel}")
-
-    # Subscribe
-    await manager.subscribe(streams)
+    streams = [f"{symbol}@{channel}" for symbol in symbols for channel in channels]
+
+    if use_combined_stream:
+        # Register the streams before connecting so they all ride in the
+        # combined stream URL instead of a separate SUBSCRIBE frame
+        await manager.subscribe(streams)
+        await manager.connect()
+    else:
+        # Raw endpoints take a single stream in the URL; subscribe the batch after
+        await manager.connect()
+        await manager.subscribe(streams)
 
     return manager
@@ -4,20 +4,25 @@ Crypto.com API Diagnostic Script
 --------------------------------
 Tests the Crypto.com unified client to verify connectivity and data retrieval for all endpoints.
 """
-import os
 import sys
 import traceback
 from pathlib import Path
 from colorama import init, Fore, Style
-from cryptotrader.config import get_logger
-from cryptotrader.services.unified_clients.cryptoRestUnifiedClient import CryptoRestUnifiedClient
+
+# Add src/ to path for local imports, resolved once at import
+project_root = Path(__file__).resolve().parents[5]
+if str(project_root / "src") not in sys.path:
+    sys.path.insert(0, str(project_root / "src"))
+
+from cryptotrader.config import get_env, get_logger  # noqa: E402
+from cryptotrader.services.unified_clients.cryptoRestUnifiedClient import CryptoRestUnifiedClient  # noqa: E402
 
 # Initialize colorama
 init(autoreset=True)
 logger = get_logger(__name__)
 
 # Test constants
-test_instrument = os.getenv("CRYPTO_TEST_INSTRUMENT", "BTC_USDT")
+test_instrument = get_env("CRYPTO_TEST_INSTRUMENT", "BTC_USDT")
 
 
 def print_test_header(name: str):
@@ -25,10 +30,6 @@ def print_test_header(name: str):
 
 
 def main():
-    # Add src/ to path for local imports
-    project_root = Path(__file__).resolve().parents[5]
-    sys.path.insert(0, str(project_root / "src"))
-
     logger.info("Initializing Crypto.com unified client...")
     client = CryptoRestUnifiedClient(testnet=True)
 
@@ -1,5 +1,6 @@
 # File: src/gui/unified_clients/binanceRestUnifiedClient.py
 
+from functools import lru_cache
 from typing import Optional, List, Set, Union
 
 from cryptotrader.config import get_logger
@@ -54,6 +55,21 @@ class BinanceRestUnifiedClient:
             req = req.withQueryParams(symbol=symbol)
         return req.execute()
 
+    async def get_24h_ticker_price_async(
+        self, symbol: Optional[str] = None
+    ) -> Union[List[dict], dict]:
+        """
+        Async variant of get_24h_ticker_price, so many symbols can be fetched at once.
+        """
+        req = self.system.request(
+            method="GET",
+            endpoint="/api/v3/ticker/24hr",
+        ).requiresAuth(False)
+
+        if symbol:
+            req = req.withQueryParams(symbol=symbol)
+        return await req.executeAsync()
+
     def place_order(self, request: OrderRequest) -> OrderResponseFull:
         """
         Place a new spot order.
@@ -93,3 +109,11 @@ class BinanceRestUnifiedClient:
         `OrderOperations.cancel_replace_order` implementation.
         """
         return self.orders.cancel_replace_order(params)
+
+
+@lru_cache(maxsize=1)
+def get_binance_client() -> BinanceRestUnifiedClient:
+    """
+    Return the process-wide BinanceRestUnifiedClient shared by the GUI components.
+    """
+    return BinanceRestUnifiedClient()